@@ -29,6 +29,10 @@ def analyze(program: VyperProgram):
     if isinstance(program, VyperInterface) and program.is_stub:
         return
 
+    # The program has already been annotated and analyzed
+    if program.analyzed:
+        return
+
     check_symbols(program)
     check_structure(program)
     TypeAnnotator(program).annotate_program()
@@ -48,6 +52,8 @@ def analyze(program: VyperProgram):
     program_analyzer.analyze(program)
     invariant_analyzer.analyze(program)
 
+    program.analyzed = True
+
 
 class ProgramAnalysis:
 
@@ -43,8 +43,9 @@ class _AccessibleHeuristics(NodeVisitor):
             else:
                 return 3
 
-        candidates = sorted((f for f in send_functions if is_canditate(f)), key=val)
-        program.analysis.accessible_function = first(candidates)
+        # min returns the first candidate with the lowest value
+        candidates = (f for f in send_functions if is_canditate(f))
+        program.analysis.accessible_function = min(candidates, key=val, default=None)
 
     def visit_FunctionCall(self, node: ast.FunctionCall, function: VyperFunction, send_functions: List[VyperFunction]):
         is_send = node.name == names.SEND
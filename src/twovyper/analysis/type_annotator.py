@@ -5,11 +5,11 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from itertools import zip_longest
+from itertools import chain, zip_longest
 from contextlib import contextmanager
-from typing import Optional, Union, Dict, Iterable
+from typing import Any, Optional, Union, Dict, Iterable
 
-from twovyper.utils import first_index, switch, first
+from twovyper.utils import first_index, switch
 
 from twovyper.ast import ast_nodes as ast, names, types
 from twovyper.ast.arithmetic import Decimal
@@ -25,11 +25,56 @@ from twovyper.exceptions import InvalidProgramException, UnsupportedException
 from twovyper.vyper import is_compatible_version, select_version
 
 
+_MAX_INT128 = 2 ** 127 - 1
+_MAX_ADDRESS = 2 ** 160 - 1
+
+
 def _check(condition: bool, node: ast.Node, reason_code: str, msg: Optional[str] = None):
     if not condition:
         raise InvalidProgramException(node, reason_code, msg)
 
 
+def _is_non_strict_array(t) -> bool:
+    return isinstance(t, ArrayType) and not t.is_strict
+
+
+def _longest_array(matching: ArrayType, lst, node: ast.Node) -> ArrayType:
+    arrays = [t for t in lst if _is_non_strict_array(t) and t.element_type == matching.element_type]
+    _check(bool(arrays), node, 'wrong.type')
+    return max(arrays, key=lambda t: t.size)
+
+
+def _intersect(l1, l2, node: ast.Node):
+    for e in l1:
+        if _is_non_strict_array(e):
+            yield _longest_array(e, l2, node)
+        else:
+            for t in l2:
+                if types.matches(e, t):
+                    yield e
+                elif types.matches(t, e):
+                    yield t
+
+
+def _type_annotation_key(node: ast.Node):
+    # Key of a type annotation made of names and constant array sizes, None for any other annotation
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Subscript) and isinstance(node.index, ast.Num):
+        element_key = _type_annotation_key(node.value)
+        if element_key is not None:
+            return element_key, node.index.n
+    return None
+
+
+def _is_subscriptable(t) -> bool:
+    return isinstance(t, (ArrayType, MapType))
+
+
+def _visit_no_op(node: ast.Node):
+    return None
+
+
 class TypeAnnotator(NodeVisitor):
 
     # The type annotator annotates all expression nodes with type information.
@@ -56,6 +101,8 @@ class TypeAnnotator(NodeVisitor):
             type_map[name] = interface.type
 
         self.type_builder = TypeBuilder(type_map)
+        # Quantifiers mostly repeat the same few types, so built types are shared per annotation
+        self._quantified_types: Dict[Any, VyperType] = {}
 
         self.program = program
         self.current_func: Union[VyperFunction, None] = None
@@ -80,6 +127,10 @@ class TypeAnnotator(NodeVisitor):
         self.undecided_nodes = False
         self.type_resolver = TypeResolver()
 
+        # Statements without anything to annotate are seeded into the visitor cache with a plain function,
+        # so visiting them neither resolves a method name nor creates a bound method
+        self._visitor_cache = dict.fromkeys((ast.Pass, ast.Continue, ast.Break), _visit_no_op)
+
     @contextmanager
     def _function_scope(self, func: Union[VyperFunction, GhostFunction]):
         old_func = self.current_func
@@ -247,35 +298,15 @@ class TypeAnnotator(NodeVisitor):
         types1, nodes1 = self.visit(node1)
         types2, nodes2 = self.visit(node2)
 
-        def is_array(t):
-            return isinstance(t, ArrayType) and not t.is_strict
-
-        def longest_array(matching, lst):
-            try:
-                arrays = [t for t in lst if is_array(t) and t.element_type == matching.element_type]
-                return max(arrays, key=lambda t: t.size)
-            except ValueError:
-                raise InvalidProgramException(node if node is not None else node2, 'wrong.type')
-
-        def intersect(l1, l2):
-            for e in l1:
-                if is_array(e):
-                    yield longest_array(e, l2)
-                else:
-                    for t in l2:
-                        if types.matches(e, t):
-                            yield e
-                        elif types.matches(t, e):
-                            yield t
-
-        intersection = list(filter(allowed, intersect(types1, types2)))
+        intersection = list(filter(allowed, _intersect(types1, types2, node if node is not None else node2)))
         if not intersection:
             raise InvalidProgramException(node if node is not None else node2, 'wrong.type')
         else:
+            # Like in pass_through, the node lists returned by visits are not shared and can be extended
+            nodes1.extend(nodes2)
             if node:
-                return intersection, [*nodes1, *nodes2, node]
-            else:
-                return intersection, [*nodes1, *nodes2]
+                nodes1.append(node)
+            return intersection, nodes1
 
     def annotate(self, node1, node2=None, allowed=lambda t: True, resolve=False):
         if node2 is None:
@@ -298,29 +329,33 @@ class TypeAnnotator(NodeVisitor):
         Checks that node has type `expected` (or matches the predicate `expected`) or, if that isn't the case,
         that is has type `orelse` (or matches the predicate `orelse`).
         """
+        # The `orelse` check reuses the possible types of this visit
         tps, nodes = self.visit(node)
 
-        def annotate_nodes(t):
+        def annotate_nodes(t, resolve_node):
             node.type = t
             for n in nodes:
                 n.type = t
-            if resolve:
+            if resolve_node:
                 self.resolve_type(node)
 
-        if isinstance(expected, VyperType):
-            if any(types.matches(t, expected) for t in tps):
-                annotate_nodes(expected)
-                return
-        else:
-            for t in tps:
-                if expected(t):
-                    annotate_nodes(t)
-                    return
+        def matches(exp, resolve_node):
+            if isinstance(exp, VyperType):
+                if any(types.matches(t, exp) for t in tps):
+                    annotate_nodes(exp, resolve_node)
+                    return True
+            else:
+                for t in tps:
+                    if exp(t):
+                        annotate_nodes(t, resolve_node)
+                        return True
+            return False
 
-        if orelse:
-            self.annotate_expected(node, orelse)
-        else:
-            raise InvalidProgramException(node, 'wrong.type')
+        if matches(expected, resolve):
+            return
+        if orelse and matches(orelse, False):
+            return
+        raise InvalidProgramException(node, 'wrong.type')
 
     def visit_FunctionDef(self, node: ast.FunctionDef):
         for stmt in node.body:
@@ -375,7 +410,7 @@ class TypeAnnotator(NodeVisitor):
 
     def visit_If(self, node: ast.If):
         self.annotate_expected(node.test, types.VYPER_BOOL)
-        for stmt in node.body + node.orelse:
+        for stmt in chain(node.body, node.orelse):
             self.visit(stmt)
 
     def visit_Raise(self, node: ast.Raise):
@@ -397,15 +432,6 @@ class TypeAnnotator(NodeVisitor):
         for kw in node.body.keywords:
             self.annotate(kw.value)
 
-    def visit_Pass(self, node: ast.Pass):
-        pass
-
-    def visit_Continue(self, node: ast.Continue):
-        pass
-
-    def visit_Break(self, node: ast.Break):
-        pass
-
     def visit_BoolOp(self, node: ast.BoolOp):
         self.annotate_expected(node.left, types.VYPER_BOOL)
         self.annotate_expected(node.right, types.VYPER_BOOL)
@@ -916,10 +942,10 @@ class TypeAnnotator(NodeVisitor):
                 possible_functions = self.program.ghost_functions[name]
                 if len(possible_functions) != 1:
                     if isinstance(self.program, VyperInterface):
-                        function = [fun for fun in possible_functions if fun.file == self.program.file][0]
+                        function = next(fun for fun in possible_functions if fun.file == self.program.file)
                     else:
-                        implemented_interfaces = [self.program.interfaces[i.name].file for i in self.program.implements]
-                        function = [fun for fun in possible_functions if fun.file in implemented_interfaces][0]
+                        implemented_interfaces = self.program.implemented_interface_files()
+                        function = next(fun for fun in possible_functions if fun.file in implemented_interfaces)
                 else:
                     function = possible_functions[0]
                 self.check_number_of_arguments(node, len(function.args) + 1)
@@ -1029,8 +1055,7 @@ class TypeAnnotator(NodeVisitor):
                         function = self.program.ghost_functions[node.name][0]
                 _check(isinstance(function.type.return_type, types.InterfaceType), node, 'invalid.resource.address')
                 assert isinstance(function.type.return_type, types.InterfaceType)
-                program = first(interface for interface in self.program.interfaces.values()
-                                if interface.file == function.file) or self.program
+                program = self.program.interfaces_by_file.get(function.file) or self.program
                 ref_interface = program.interfaces[function.type.return_type.name]
             else:
                 self.check_number_of_arguments(node, 1)
@@ -1044,8 +1069,7 @@ class TypeAnnotator(NodeVisitor):
             function = self.program.interfaces[interface_name].own_ghost_functions.get(node.name)
             _check(isinstance(function.type.return_type, types.InterfaceType), node, 'invalid.resource.address')
             assert isinstance(function.type.return_type, types.InterfaceType)
-            program = first(interface for interface in self.program.interfaces.values()
-                            if interface.file == function.file) or self.program
+            program = self.program.interfaces_by_file.get(function.file) or self.program
             ref_interface = program.interfaces[function.type.return_type.name]
 
             _check(is_wei or resource_name in ref_interface.own_resources, node, 'invalid.resource.address')
@@ -1076,8 +1100,8 @@ class TypeAnnotator(NodeVisitor):
                 if (top and self.program.file != resource.file
                         and resource.name != names.WEI
                         and resource.name != names.UNDERLYING_WEI):
-                    interface = first(i for i in self.program.interfaces.values() if i.file == resource.file)
-                    _check(any(i.name == interface.name for i in self.program.implements), node, 'invalid.resource')
+                    interface = self.program.interfaces_by_file.get(resource.file)
+                    _check(interface.name in self.program.implemented_interface_names, node, 'invalid.resource')
                     _check(node.id in interface.declared_resources, node, 'invalid.resource')
             else:
                 resource = self.program.declared_resources.get(node.id)
@@ -1100,15 +1124,15 @@ class TypeAnnotator(NodeVisitor):
             elif (top and self.program.file != resource.file
                     and resource.name != names.WEI
                     and resource.name != names.UNDERLYING_WEI):
-                interface = first(i for i in self.program.interfaces.values() if i.file == resource.file)
-                _check(any(i.name == interface.name for i in self.program.implements), node, 'invalid.resource')
+                interface = self.program.interfaces_by_file.get(resource.file)
+                _check(interface.name in self.program.implemented_interface_names, node, 'invalid.resource')
                 _check(node.name in interface.declared_resources, node, 'invalid.resource')
             args = node.args
         elif isinstance(node, ast.Attribute):
             assert isinstance(node.value, ast.Name)
             interface = self.program.interfaces[node.value.id]
             if top:
-                _check(any(i.name == interface.name for i in self.program.implements), node, 'invalid.resource')
+                _check(interface.name in self.program.implemented_interface_names, node, 'invalid.resource')
                 _check(node.attr in interface.declared_resources, node, 'invalid.resource')
             resource = interface.declared_resources.get(node.attr)
             args = []
@@ -1117,7 +1141,7 @@ class TypeAnnotator(NodeVisitor):
             if isinstance(node.receiver, ast.Name):
                 interface = self.program.interfaces[node.receiver.id]
                 if top:
-                    _check(any(i.name == interface.name for i in self.program.implements), node, 'invalid.resource')
+                    _check(interface.name in self.program.implemented_interface_names, node, 'invalid.resource')
                     _check(node.name in interface.declared_resources, node, 'invalid.resource')
             elif isinstance(node.receiver, ast.Subscript):
                 assert isinstance(node.receiver.value, ast.Attribute)
@@ -1179,7 +1203,12 @@ class TypeAnnotator(NodeVisitor):
     def _add_quantified_vars(self, var_decls: ast.Dict):
         vars_types = zip(var_decls.keys, var_decls.values)
         for name, type_annotation in vars_types:
-            var_type = self.type_builder.build(type_annotation)
+            key = _type_annotation_key(type_annotation)
+            var_type = None if key is None else self._quantified_types.get(key)
+            if var_type is None:
+                var_type = self.type_builder.build(type_annotation)
+                if key is not None:
+                    self._quantified_types[key] = var_type
             self.variables[name.id] = [var_type]
             name.type = var_type
 
@@ -1315,18 +1344,16 @@ class TypeAnnotator(NodeVisitor):
     @staticmethod
     def visit_Num(node: ast.Num):
         if isinstance(node.n, int):
-            max_int128 = 2 ** 127 - 1
-            max_address = 2 ** 160 - 1
-            if 0 <= node.n <= max_int128:
+            if 0 <= node.n <= _MAX_INT128:
                 tps = [types.VYPER_INT128,
                        types.VYPER_UINT256,
                        types.VYPER_ADDRESS,
                        types.VYPER_BYTES32]
-            elif max_int128 < node.n <= max_address:
+            elif _MAX_INT128 < node.n <= _MAX_ADDRESS:
                 tps = [types.VYPER_UINT256,
                        types.VYPER_ADDRESS,
                        types.VYPER_BYTES32]
-            elif max_address < node.n:
+            elif _MAX_ADDRESS < node.n:
                 tps = [types.VYPER_UINT256,
                        types.VYPER_BYTES32]
             else:
@@ -1351,22 +1378,23 @@ class TypeAnnotator(NodeVisitor):
         return [ntype], [node]
 
     def visit_Subscript(self, node: ast.Subscript):
-        self.annotate_expected(node.value, lambda t: isinstance(t, (ArrayType, MapType)))
-        if isinstance(node.value.type, MapType):
-            key_type = node.value.type.key_type
-            self.annotate_expected(node.index, key_type)
-            ntype = node.value.type.value_type
-        elif isinstance(node.value.type, ArrayType):
+        self.annotate_expected(node.value, _is_subscriptable)
+        value_type = node.value.type
+        if isinstance(value_type, MapType):
+            self.annotate_expected(node.index, value_type.key_type)
+            ntype = value_type.value_type
+        elif isinstance(value_type, ArrayType):
             self.annotate_expected(node.index, types.is_integer)
-            ntype = node.value.type.element_type
+            ntype = value_type.element_type
         else:
             assert False
 
         return [ntype], [node]
 
     def visit_Name(self, node: ast.Name):
-        _check(node.id in self.variables, node, 'invalid.local.var')
-        return self.variables[node.id], [node]
+        variable_type = self.variables.get(node.id)
+        _check(variable_type is not None, node, 'invalid.local.var')
+        return variable_type, [node]
 
     def visit_List(self, node: ast.List):
         # Vyper guarantees that size > 0
@@ -69,7 +69,7 @@ TX_ORIGIN = 'origin'
 LOG = 'log'
 LEMMA = 'lemma'
 
-ENV_VARIABLES = [MSG, BLOCK, CHAIN, TX]
+ENV_VARIABLES = frozenset([MSG, BLOCK, CHAIN, TX])
 
 # Constants
 EMPTY_BYTES32 = 'EMPTY_BYTES32'
@@ -180,8 +180,8 @@ CONFIG_NO_OVERFLOWS = 'no_overflows'
 CONFIG_NO_PERFORMS = 'no_performs'
 CONFIG_NO_DERIVED_WEI = 'no_derived_wei_resource'
 CONFIG_TRUST_CASTS = 'trust_casts'
-CONFIG_OPTIONS = [CONFIG_ALLOCATION, CONFIG_NO_GAS, CONFIG_NO_OVERFLOWS, CONFIG_NO_PERFORMS, CONFIG_NO_DERIVED_WEI,
-                  CONFIG_TRUST_CASTS]
+CONFIG_OPTIONS = frozenset([CONFIG_ALLOCATION, CONFIG_NO_GAS, CONFIG_NO_OVERFLOWS, CONFIG_NO_PERFORMS,
+                            CONFIG_NO_DERIVED_WEI, CONFIG_TRUST_CASTS])
 
 INTERFACE = 'internal_interface'
 
@@ -227,7 +227,7 @@ SUCCESS_IF_NOT = 'if_not'
 SUCCESS_OVERFLOW = 'overflow'
 SUCCESS_OUT_OF_GAS = 'out_of_gas'
 SUCCESS_SENDER_FAILED = 'sender_failed'
-SUCCESS_CONDITIONS = [SUCCESS_OVERFLOW, SUCCESS_OUT_OF_GAS, SUCCESS_SENDER_FAILED]
+SUCCESS_CONDITIONS = frozenset([SUCCESS_OVERFLOW, SUCCESS_OUT_OF_GAS, SUCCESS_SENDER_FAILED])
 
 WEI = 'wei'
 UNDERLYING_WEI = 'Wei'
@@ -285,51 +285,55 @@ CREATOR = 'creator'
 RESOURCE_PREFIX = "r_"
 DERIVED_RESOURCE_PREFIX = "d_"
 
-GHOST_STATEMENTS = [REALLOCATE, FOREACH, OFFER, REVOKE, EXCHANGE, CREATE, DESTROY, TRUST, ALLOCATE_UNTRACKED,
-                    ALLOW_TO_DECOMPOSE, RESOURCE_PAYABLE, RESOURCE_PAYOUT]
-QUANTIFIED_GHOST_STATEMENTS = [OFFER, REVOKE, CREATE, DESTROY, TRUST]
-SPECIAL_RESOURCES = [WEI, CREATOR]
-ALLOCATION_SPECIFICATION_FUNCTIONS = [ALLOCATED, OFFERED, NO_OFFERS, TRUSTED, TRUST_NO_ONE, ALLOWED_TO_DECOMPOSE]
-ALLOCATION_FUNCTIONS = [*ALLOCATION_SPECIFICATION_FUNCTIONS, *GHOST_STATEMENTS]
-
-NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS = [PREVIOUS, LOOP_ARRAY, LOOP_ITERATION]
-
-NOT_ALLOWED_IN_SPEC = [ASSERT_MODIFIABLE, CLEAR, SEND, RAW_CALL, RAW_LOG, CREATE_FORWARDER_TO]
-NOT_ALLOWED_IN_INVARIANT = [*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED, ISSUED, BLOCKHASH,
-                            INDEPENDENT, REORDER_INDEPENDENT, EVENT, PUBLIC_OLD,  INTERPRETED, CONDITIONAL,
-                            *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS]
-NOT_ALLOWED_IN_LOOP_INVARIANT = [*NOT_ALLOWED_IN_SPEC, CALLER, ACCESSIBLE, OVERFLOW, OUT_OF_GAS, FAILED,
-                                 ACCESSIBLE, INDEPENDENT, REORDER_INDEPENDENT, INTERPRETED, CONDITIONAL,
-                                 *GHOST_STATEMENTS]
-NOT_ALLOWED_IN_CHECK = [*NOT_ALLOWED_IN_SPEC, CALLER, INDEPENDENT, ACCESSIBLE, PUBLIC_OLD,
-                        INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS]
-NOT_ALLOWED_IN_POSTCONDITION = [*NOT_ALLOWED_IN_SPEC, CALLER, ACCESSIBLE, INTERPRETED, CONDITIONAL,
-                                *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS]
-NOT_ALLOWED_IN_PRECONDITION = [*NOT_ALLOWED_IN_SPEC, CALLER, ACCESSIBLE, SUCCESS, REVERT, OVERFLOW, OUT_OF_GAS, FAILED,
-                               RESULT, ACCESSIBLE, OLD, INDEPENDENT, REORDER_INDEPENDENT,
-                               INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS]
-NOT_ALLOWED_IN_TRANSITIVE_POSTCONDITION = [*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED,
-                                           INDEPENDENT, REORDER_INDEPENDENT, EVENT, ACCESSIBLE, PUBLIC_OLD,
-                                           INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS,
-                                           *GHOST_STATEMENTS]
-NOT_ALLOWED_IN_CALLER_PRIVATE = [*NOT_ALLOWED_IN_SPEC, IMPLIES, FORALL, SUM, RESULT, STORAGE, OLD, PUBLIC_OLD, ISSUED,
-                                 SENT, RECEIVED, ACCESSIBLE, INDEPENDENT, REORDER_INDEPENDENT, EVENT, SELFDESTRUCT,
-                                 IMPLEMENTS, LOCKED, REVERT, OVERFLOW, OUT_OF_GAS, FAILED, SUCCESS,
-                                 BLOCKHASH, *ALLOCATION_FUNCTIONS, INTERPRETED, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS]
-NOT_ALLOWED_IN_GHOST_CODE = [*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED, INDEPENDENT,
-                             REORDER_INDEPENDENT, ACCESSIBLE, PUBLIC_OLD, SELFDESTRUCT,
-                             CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS]
-NOT_ALLOWED_IN_GHOST_FUNCTION = [*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED,
-                                 STORAGE, OLD, PUBLIC_OLD, ISSUED, BLOCKHASH, SENT, RECEIVED, ACCESSIBLE,
-                                 INDEPENDENT, REORDER_INDEPENDENT, SELFDESTRUCT, INTERPRETED, CONDITIONAL,
-                                 *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS]
-NOT_ALLOWED_IN_GHOST_STATEMENT = [*NOT_ALLOWED_IN_SPEC, CALLER, SUCCESS, REVERT, OVERFLOW, OUT_OF_GAS, FAILED, RESULT,
-                                  ACCESSIBLE, INDEPENDENT, REORDER_INDEPENDENT, PUBLIC_OLD, SELFDESTRUCT,
-                                  INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS]
-NOT_ALLOWED_IN_LEMMAS = [*NOT_ALLOWED_IN_SPEC, RESULT, STORAGE, OLD, PUBLIC_OLD, ISSUED, SENT, RECEIVED, ACCESSIBLE,
-                         INDEPENDENT, REORDER_INDEPENDENT, EVENT, SELFDESTRUCT, IMPLEMENTS, LOCKED, REVERT,
-                         INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, OVERFLOW, OUT_OF_GAS, FAILED,
-                         CALLER, SUCCESS, *ALLOCATION_FUNCTIONS]
+GHOST_STATEMENTS = frozenset([REALLOCATE, FOREACH, OFFER, REVOKE, EXCHANGE, CREATE, DESTROY, TRUST, ALLOCATE_UNTRACKED,
+                              ALLOW_TO_DECOMPOSE, RESOURCE_PAYABLE, RESOURCE_PAYOUT])
+QUANTIFIED_GHOST_STATEMENTS = frozenset([OFFER, REVOKE, CREATE, DESTROY, TRUST])
+SPECIAL_RESOURCES = frozenset([WEI, CREATOR])
+ALLOCATION_SPECIFICATION_FUNCTIONS = frozenset([ALLOCATED, OFFERED, NO_OFFERS, TRUSTED, TRUST_NO_ONE,
+                                                ALLOWED_TO_DECOMPOSE])
+ALLOCATION_FUNCTIONS = frozenset([*ALLOCATION_SPECIFICATION_FUNCTIONS, *GHOST_STATEMENTS])
+
+NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS = frozenset([PREVIOUS, LOOP_ARRAY, LOOP_ITERATION])
+
+NOT_ALLOWED_IN_SPEC = frozenset([ASSERT_MODIFIABLE, CLEAR, SEND, RAW_CALL, RAW_LOG, CREATE_FORWARDER_TO])
+NOT_ALLOWED_IN_INVARIANT = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED, ISSUED, BLOCKHASH,
+                                      INDEPENDENT, REORDER_INDEPENDENT, EVENT, PUBLIC_OLD, INTERPRETED, CONDITIONAL,
+                                      *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS])
+NOT_ALLOWED_IN_LOOP_INVARIANT = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, ACCESSIBLE, OVERFLOW, OUT_OF_GAS, FAILED,
+                                           ACCESSIBLE, INDEPENDENT, REORDER_INDEPENDENT, INTERPRETED, CONDITIONAL,
+                                           *GHOST_STATEMENTS])
+NOT_ALLOWED_IN_CHECK = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, INDEPENDENT, ACCESSIBLE, PUBLIC_OLD, INTERPRETED,
+                                  CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS])
+NOT_ALLOWED_IN_POSTCONDITION = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, ACCESSIBLE, INTERPRETED, CONDITIONAL,
+                                          *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS])
+NOT_ALLOWED_IN_PRECONDITION = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, ACCESSIBLE, SUCCESS, REVERT, OVERFLOW,
+                                         OUT_OF_GAS, FAILED, RESULT, ACCESSIBLE, OLD, INDEPENDENT, REORDER_INDEPENDENT,
+                                         INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS,
+                                         *GHOST_STATEMENTS])
+NOT_ALLOWED_IN_TRANSITIVE_POSTCONDITION = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED,
+                                                     INDEPENDENT, REORDER_INDEPENDENT, EVENT, ACCESSIBLE, PUBLIC_OLD,
+                                                     INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS,
+                                                     *GHOST_STATEMENTS])
+NOT_ALLOWED_IN_CALLER_PRIVATE = frozenset([*NOT_ALLOWED_IN_SPEC, IMPLIES, FORALL, SUM, RESULT, STORAGE, OLD, PUBLIC_OLD,
+                                           ISSUED, SENT, RECEIVED, ACCESSIBLE, INDEPENDENT, REORDER_INDEPENDENT, EVENT,
+                                           SELFDESTRUCT, IMPLEMENTS, LOCKED, REVERT, OVERFLOW, OUT_OF_GAS, FAILED,
+                                           SUCCESS, BLOCKHASH, *ALLOCATION_FUNCTIONS, INTERPRETED,
+                                           *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS])
+NOT_ALLOWED_IN_GHOST_CODE = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED, INDEPENDENT,
+                                       REORDER_INDEPENDENT, ACCESSIBLE, PUBLIC_OLD, SELFDESTRUCT, CONDITIONAL,
+                                       *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS])
+NOT_ALLOWED_IN_GHOST_FUNCTION = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, OVERFLOW, OUT_OF_GAS, FAILED, STORAGE, OLD,
+                                           PUBLIC_OLD, ISSUED, BLOCKHASH, SENT, RECEIVED, ACCESSIBLE, INDEPENDENT,
+                                           REORDER_INDEPENDENT, SELFDESTRUCT, INTERPRETED, CONDITIONAL,
+                                           *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS, *GHOST_STATEMENTS])
+NOT_ALLOWED_IN_GHOST_STATEMENT = frozenset([*NOT_ALLOWED_IN_SPEC, CALLER, SUCCESS, REVERT, OVERFLOW, OUT_OF_GAS, FAILED,
+                                            RESULT, ACCESSIBLE, INDEPENDENT, REORDER_INDEPENDENT, PUBLIC_OLD,
+                                            SELFDESTRUCT, INTERPRETED, CONDITIONAL,
+                                            *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS])
+NOT_ALLOWED_IN_LEMMAS = frozenset([*NOT_ALLOWED_IN_SPEC, RESULT, STORAGE, OLD, PUBLIC_OLD, ISSUED, SENT, RECEIVED,
+                                   ACCESSIBLE, INDEPENDENT, REORDER_INDEPENDENT, EVENT, SELFDESTRUCT, IMPLEMENTS,
+                                   LOCKED, REVERT, INTERPRETED, CONDITIONAL, *NOT_ALLOWED_BUT_IN_LOOP_INVARIANTS,
+                                   OVERFLOW, OUT_OF_GAS, FAILED, CALLER, SUCCESS, *ALLOCATION_FUNCTIONS])
 
 # Heuristics
 WITHDRAW = 'withdraw'
@@ -7,7 +7,7 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 import os
 from collections import defaultdict
 from itertools import chain
-from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 from twovyper.ast import ast_nodes as ast, names
 from twovyper.ast.types import (
@@ -17,6 +17,10 @@ if TYPE_CHECKING:
     from twovyper.analysis.analyzer import FunctionAnalysis, ProgramAnalysis
 
 
+def _interface_name(file: Optional[str]) -> str:
+    return os.path.split(file)[1].split('.')[0] if file else ''
+
+
 class Config:
 
     def __init__(self, options: List[str]):
@@ -60,15 +64,11 @@ class VyperFunction:
         self.loop_invariants = loop_invariants
         self.performs = performs
         self.decorators = decorators
+        self._decorator_names = frozenset(dec.name for dec in decorators)
         self.node = node
         # Gets set in the analyzer
         self.analysis: Optional[FunctionAnalysis] = None
 
-    @property
-    def _decorator_names(self) -> Iterable[str]:
-        for dec in self.decorators:
-            yield dec.name
-
     def is_public(self) -> bool:
         return names.PUBLIC in self._decorator_names
 
@@ -106,10 +106,8 @@ class GhostFunction:
         self.type = type
         self.node = node
         self.file = file
-
-    @property
-    def interface(self):
-        return os.path.split(self.file)[1].split('.')[0] if self.file else ''
+        # The interface name only depends on the file, which never changes
+        self.interface = _interface_name(file)
 
 
 class VyperStruct:
@@ -132,16 +130,13 @@ class Resource(VyperStruct):
                  underlying_resource_node: Optional[ast.Expr] = None):
         super().__init__(rtype.name, rtype, node)
         self.file = file
+        self.interface = _interface_name(file)
         self.analysed = False
         self._own_address = None
         self.underlying_resource = underlying_resource_node
         self.underlying_address = None
         self.derived_resources = []
 
-    @property
-    def interface(self):
-        return os.path.split(self.file)[1].split('.')[0] if self.file else ''
-
     @property
     def underlying_resource_name(self):
         return self.type.underlying_resource.name if isinstance(self.type, DerivedResourceType) else None
@@ -210,6 +205,11 @@ class VyperProgram:
         self.fields = fields
         self.functions = functions
         self.interfaces = interfaces
+        # The interface ids used by implements(...) are their declaration order
+        self.interface_indices = {name: idx for idx, name in enumerate(interfaces)}
+        self.interfaces_by_file: Dict[str, 'VyperInterface'] = {}
+        for interface in interfaces.values():
+            self.interfaces_by_file.setdefault(interface.file, interface)
         self.structs = structs
         self.contracts = contracts
         self.events = events
@@ -229,6 +229,8 @@ class VyperProgram:
         self.general_checks = general_checks
         self.lemmas = lemmas
         self.implements = implements
+        # Names of the implemented interfaces, for constant time membership tests
+        self.implemented_interface_names = frozenset(interface.name for interface in implements)
         self.real_implements = real_implements
         self.ghost_functions: Dict[str, List[GhostFunction]] = defaultdict(list)
         for key, value in self._ghost_functions():
@@ -237,16 +239,27 @@ class VyperProgram:
         self.type = fields.type
         # Is set in the analyzer
         self.analysis: Optional[ProgramAnalysis] = None
+        # Is set in the analyzer once the analysis completed
+        self.analyzed = False
+        self._nonreentrant_keys: Optional[FrozenSet[str]] = None
+        self._implemented_interface_files: Optional[FrozenSet[str]] = None
 
     def is_interface(self) -> bool:
         return False
 
-    def nonreentrant_keys(self) -> Set[str]:
-        s = set()
-        for func in self.functions.values():
-            for key in func.nonreentrant_keys():
-                s.add(key)
-        return s
+    def nonreentrant_keys(self) -> FrozenSet[str]:
+        # The decorators of the functions do not change, collect the keys only on first use. The __init__ function
+        # the translator may add later only has a public decorator and therefore no keys.
+        if self._nonreentrant_keys is None:
+            self._nonreentrant_keys = frozenset(key for func in self.functions.values()
+                                                for key in func.nonreentrant_keys())
+        return self._nonreentrant_keys
+
+    def implemented_interface_files(self) -> FrozenSet[str]:
+        # The files of the implemented interfaces are looked up for every ghost function call and performs clause
+        if self._implemented_interface_files is None:
+            self._implemented_interface_files = frozenset(self.interfaces[i.name].file for i in self.implements)
+        return self._implemented_interface_files
 
     def _ghost_functions(self) -> Iterable[Tuple[str, GhostFunction]]:
         for interface in self.interfaces.values():
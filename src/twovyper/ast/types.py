@@ -249,20 +249,27 @@ TX_TYPE = StructType(names.TX, {
 })
 
 
+# These are checked for every translated operation, compare by hash instead of by list scan
+_NUMERIC_TYPES = frozenset([VYPER_INT128, VYPER_UINT256, VYPER_DECIMAL, NON_NEGATIVE_INT])
+_BOUNDED_TYPES = frozenset([VYPER_INT128, VYPER_UINT256, VYPER_DECIMAL, VYPER_ADDRESS])
+_INTEGER_TYPES = frozenset([VYPER_INT128, VYPER_UINT256, NON_NEGATIVE_INT])
+_UNSIGNED_TYPES = frozenset([VYPER_UINT256, VYPER_ADDRESS, NON_NEGATIVE_INT])
+
+
 def is_numeric(type: VyperType) -> bool:
-    return type in [VYPER_INT128, VYPER_UINT256, VYPER_DECIMAL, NON_NEGATIVE_INT]
+    return type in _NUMERIC_TYPES
 
 
 def is_bounded(type: VyperType) -> bool:
-    return type in [VYPER_INT128, VYPER_UINT256, VYPER_DECIMAL, VYPER_ADDRESS]
+    return type in _BOUNDED_TYPES
 
 
 def is_integer(type: VyperType) -> bool:
-    return type in [VYPER_INT128, VYPER_UINT256, NON_NEGATIVE_INT]
+    return type in _INTEGER_TYPES
 
 
 def is_unsigned(type: VyperType) -> bool:
-    return type in [VYPER_UINT256, VYPER_ADDRESS, NON_NEGATIVE_INT]
+    return type in _UNSIGNED_TYPES
 
 
 def has_strict_array_size(element_type: VyperType) -> bool:
@@ -15,32 +15,44 @@ def children(node: ast.Node) -> Iterable[Tuple[str, Union[Optional[ast.Node], Li
         yield child, getattr(node, child)
 
 
-# TODO: improve
 def descendants(node: ast.Node) -> Iterable[ast.Node]:
-    for _, child in children(node):
-        if child is None:
-            continue
-        elif isinstance(child, ast.Node):
-            yield child
-
-            for child_child in descendants(child):
-                yield child_child
-        elif isinstance(child, List):
-            for child_child in child:
-                yield child_child
-                for child_child_child in descendants(child_child):
-                    yield child_child_child
+    # Iterative pre-order traversal, nested generators would make every yield cost O(depth)
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current is not node:
+            yield current
+
+        current_children = []
+        for _, child in children(current):
+            if child is None:
+                continue
+            elif isinstance(child, ast.Node):
+                current_children.append(child)
+            elif isinstance(child, list):
+                current_children.extend(child)
+        stack.extend(reversed(current_children))
 
 
 class NodeVisitor:
 
+    # Maps node classes to the bound visitor method, filled lazily per visitor instance
+    _visitor_cache = None
+
     @property
     def method_name(self) -> str:
         return 'visit'
 
     def visit(self, node, *args):
-        method = f'{self.method_name}_{node.__class__.__name__}'
-        visitor = getattr(self, method, self.generic_visit)
+        cache = self._visitor_cache
+        if cache is None:
+            cache = self._visitor_cache = {}
+        node_class = node.__class__
+        visitor = cache.get(node_class)
+        if visitor is None:
+            method = f'{self.method_name}_{node_class.__name__}'
+            visitor = getattr(self, method, self.generic_visit)
+            cache[node_class] = visitor
         return visitor(node, *args)
 
     def visit_nodes(self, nodes: Iterable[ast.Node], *args):
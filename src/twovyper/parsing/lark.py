@@ -6,7 +6,8 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
 from functools import reduce
-from typing import Any, Dict, List
+from itertools import chain
+from typing import Any, List
 import re
 
 from lark import Lark
@@ -17,7 +18,7 @@ from lark.visitors import Transformer, v_args
 
 from twovyper.ast import ast_nodes as ast, names
 from twovyper.ast.arithmetic import Decimal
-from twovyper.ast.visitors import NodeVisitor
+from twovyper.ast.visitors import descendants
 
 from twovyper.exceptions import ParseException, InvalidProgramException
 from twovyper.vyper import select_version
@@ -576,40 +577,28 @@ def parse(parser, text, file):
         raise e.orig_exc
 
 
-class CodeVisitor(NodeVisitor):
+def _find_lost_code_information(text: str, node: ast.Node):
+    lines = text.splitlines()
+    ghost = {}
+    lemmas = {}
+    pattern = re.compile(r'#@\s*lemma_(def|assert).*')
+    for idx, line in enumerate(lines):
+        line_strip = line.strip()
+        ghost[idx + 1] = line_strip.startswith('#@')
+        match = pattern.match(line_strip)
+        lemmas[idx + 1] = match is not None
 
-    def find_lost_code_information(self, text: str, node: ast.Node):
-        lines = text.splitlines()
-        ghost = {}
-        lemmas = {}
-        pattern = re.compile(r'#@\s*lemma_(def|assert).*')
-        for idx, line in enumerate(lines):
-            line_strip = line.strip()
-            ghost[idx + 1] = line_strip.startswith('#@')
-            match = pattern.match(line_strip)
-            lemmas[idx + 1] = match is not None
-
-        self.visit(node, ghost, lemmas)
-
-    def generic_visit(self, node: ast.Node, *args):
-        ghost: Dict[int, bool] = args[0]
-        node.is_ghost_code = ghost[node.lineno]
-        super().generic_visit(node, *args)
-
-    def visit_FunctionDef(self, node: ast.FunctionDef, *args):
-        lemmas: Dict[int, bool] = args[1]
-        node.is_lemma = lemmas[node.lineno] or lemmas[node.lineno + len(node.decorators)]
-        self.generic_visit(node, *args)
-
-    def visit_Assert(self, node: ast.Assert, *args):
-        lemmas: Dict[int, bool] = args[1]
-        node.is_lemma = lemmas[node.lineno]
-        self.generic_visit(node, *args)
+    for n in chain([node], descendants(node)):
+        n.is_ghost_code = ghost[n.lineno]
+        if isinstance(n, ast.FunctionDef):
+            n.is_lemma = lemmas[n.lineno] or lemmas[n.lineno + len(n.decorators)]
+        elif isinstance(n, ast.Assert):
+            n.is_lemma = lemmas[n.lineno]
 
 
 def parse_module(text, original, file) -> ast.Module:
     node = parse(_vyper_module_parser, text + '\n', file)
-    CodeVisitor().find_lost_code_information(original, node)
+    _find_lost_code_information(original, node)
     return node
 
 
@@ -9,7 +9,7 @@ import os
 
 from contextlib import contextmanager
 
-from typing import Optional, Dict, Union, List
+from typing import Optional, Dict, Union, List, Set
 
 from twovyper.parsing.lark import copy_pos_from
 from twovyper.utils import switch, first
@@ -91,17 +91,22 @@ class ProgramBuilder(NodeVisitor):
 
         self.is_preserves = False
 
+        # Gets reset whenever a struct, contract or interface is added
+        self._type_builder: Optional[TypeBuilder] = None
+
     @property
     def type_builder(self):
-        type_map = {}
-        for name, struct in self.structs.items():
-            type_map[name] = struct.type
-        for name, contract in self.contracts.items():
-            type_map[name] = contract.type
-        for name, interface in self.interfaces.items():
-            type_map[name] = interface.type
-
-        return TypeBuilder(type_map, not self.parse_further_interfaces)
+        if self._type_builder is None:
+            type_map = {}
+            for name, struct in self.structs.items():
+                type_map[name] = struct.type
+            for name, contract in self.contracts.items():
+                type_map[name] = contract.type
+            for name, interface in self.interfaces.items():
+                type_map[name] = interface.type
+
+            self._type_builder = TypeBuilder(type_map, not self.parse_further_interfaces)
+        return self._type_builder
 
     def build(self, node) -> VyperProgram:
         self.visit(node)
@@ -248,6 +253,7 @@ class ProgramBuilder(NodeVisitor):
                 raise UnsupportedException(node, 'Invalid file name.')
             interface = parse(file, self.root, True, name, self.parse_level + 1)
             self.interfaces[name] = interface
+            self._type_builder = None
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
         if node.is_ghost_code:
@@ -268,6 +274,7 @@ class ProgramBuilder(NodeVisitor):
                     self.contracts[name] = VyperContract(name, interfaces.ERC721_TYPE, None)
                 else:
                     assert False
+            self._type_builder = None
 
             return
 
@@ -291,12 +298,14 @@ class ProgramBuilder(NodeVisitor):
                 raise UnsupportedException(node, 'Invalid file name.')
             interface = parse(file, self.root, True, name, self.parse_level + 1)
             self.interfaces[name] = interface
+            self._type_builder = None
 
     def visit_StructDef(self, node: ast.StructDef):
         vyper_type = self.type_builder.build(node)
         assert isinstance(vyper_type, StructType)
         struct = VyperStruct(node.name, vyper_type, node)
         self.structs[struct.name] = struct
+        self._type_builder = None
 
     def visit_EventDef(self, node: ast.EventDef):
         vyper_type = self.type_builder.build(node)
@@ -329,6 +338,7 @@ class ProgramBuilder(NodeVisitor):
         if isinstance(vyper_type, ContractType):
             contract = VyperContract(node.name, vyper_type, node)
             self.contracts[contract.name] = contract
+            self._type_builder = None
 
     def visit_AnnAssign(self, node: ast.AnnAssign):
         if node.is_ghost_code:
@@ -529,7 +539,7 @@ class LoopInvariantTransformer(NodeTransformer):
 
     def __init__(self):
         self._last_loop: Union[ast.For, None] = None
-        self._possible_loop_invariant_nodes: List[ast.Assign] = []
+        self._possible_loop_invariant_nodes: Set[ast.Assign] = set()
         self.loop_invariants: Dict[ast.For, List[ast.Expr]] = {}
 
     @contextmanager
@@ -557,10 +567,11 @@ class LoopInvariantTransformer(NodeTransformer):
 
     def visit_For(self, node: ast.For):
         with self._in_loop_scope(node):
-            self._possible_loop_invariant_nodes = []
+            # The invariants at the beginning of the loop, looked up for every invariant in the loop body
+            self._possible_loop_invariant_nodes = set()
             for n in node.body:
                 if isinstance(n, ast.Assign) and n.is_ghost_code and n.target.id == names.INVARIANT:
-                    self._possible_loop_invariant_nodes.append(n)
+                    self._possible_loop_invariant_nodes.add(n)
                 else:
                     break
             return self.generic_visit(node)
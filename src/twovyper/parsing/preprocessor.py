@@ -10,39 +10,42 @@ import re
 from twovyper.ast.names import RESOURCE_PREFIX, DERIVED_RESOURCE_PREFIX
 
 
+# The specification comments and the start and end of the statement they are replaced with
+_SPECIFICATIONS = [
+    (r'#@\s*config\s*:', 'config', '='),
+    (r'#@\s*interface', 'internal_interface', '=True'),
+    (r'#@\s*ghost\s*:', 'with(g)', ':'),
+    (r'#@\s*resource\s*:\s*', 'def ', RESOURCE_PREFIX),
+    (r'#@\s*derived\s*resource\s*:\s*', 'def ', DERIVED_RESOURCE_PREFIX),
+    (r'#@\s*ensures\s*:', 'ensures', '='),
+    (r'#@\s*requires\s*:', 'requires', '='),
+    (r'#@\s*check\s*:', 'check', '='),
+    (r'#@\s*performs\s*:', 'performs', '='),
+    (r'#@\s*invariant\s*:', 'invariant', '='),
+    (r'#@\s*inter\s*contract\s*invariant\s*:', 'inter_contract_invariant', '='),
+    (r'#@\s*always\s*ensures\s*:', 'always_ensures', '='),
+    (r'#@\s*always\s*check\s*:', 'always_check', '='),
+    (r'#@\s*caller\s*private\s*:', 'caller_private', '='),
+    (r'#@\s*preserves\s*:', 'if False', ':'),
+    (r'#@\s*pure', '@pure', ''),
+    (r'#@\s*interpreted', '@interpreted', ''),
+    (r'#@\s*lemma_def', 'def', ''),
+    (r'#@\s*lemma_assert', 'assert', ''),
+]
+
+# Every specification starts with '#@' and no replacement contains it, so at most one specification matches at
+# any position and all of them can be replaced in a single pass over the program
+_SPECIFICATION_REGEX = re.compile('|'.join(f'({regex})' for regex, _, _ in _SPECIFICATIONS), re.MULTILINE)
+
+
 def preprocess(program: str) -> str:
     # Make specifications valid python statements. We use assignments instead of variable
     # declarations because we could have contract variables called 'ensures'.
     # Padding with spaces is used to keep the column numbers correct in the preprocessed program.
 
-    def padding(old_length: int, match_length: int) -> str:
-        return (match_length - old_length) * ' '
-
-    def replacement(start: str, end: str):
-        old_length = len(start) + len(end)
-        return lambda m: f'{start}{padding(old_length, len(m.group(0)))}{end}'
-
-    def replace(regex, repl):
-        nonlocal program
-        program = re.sub(regex, repl, program, flags=re.MULTILINE)
-
-    replace(r'#@\s*config\s*:', replacement('config', '='))
-    replace(r'#@\s*interface', replacement('internal_interface', '=True'))
-    replace(r'#@\s*ghost\s*:', replacement('with(g)', ':'))
-    replace(r'#@\s*resource\s*:\s*', replacement('def ', RESOURCE_PREFIX))
-    replace(r'#@\s*derived\s*resource\s*:\s*', replacement('def ', DERIVED_RESOURCE_PREFIX))
-    replace(r'#@\s*ensures\s*:', replacement('ensures', '='))
-    replace(r'#@\s*requires\s*:', replacement('requires', '='))
-    replace(r'#@\s*check\s*:', replacement('check', '='))
-    replace(r'#@\s*performs\s*:', replacement('performs', '='))
-    replace(r'#@\s*invariant\s*:', replacement('invariant', '='))
-    replace(r'#@\s*inter\s*contract\s*invariant\s*:', replacement('inter_contract_invariant', '='))
-    replace(r'#@\s*always\s*ensures\s*:', replacement('always_ensures', '='))
-    replace(r'#@\s*always\s*check\s*:', replacement('always_check', '='))
-    replace(r'#@\s*caller\s*private\s*:', replacement('caller_private', '='))
-    replace(r'#@\s*preserves\s*:', replacement('if False', ':'))
-    replace(r'#@\s*pure', replacement('@pure', ''))
-    replace(r'#@\s*interpreted', replacement('@interpreted', ''))
-    replace(r'#@\s*lemma_def', replacement('def', ''))
-    replace(r'#@\s*lemma_assert', replacement('assert', ''))
-    return program
+    def replacement(match) -> str:
+        _, start, end = _SPECIFICATIONS[match.lastindex - 1]
+        padding = (len(match.group(0)) - len(start) - len(end)) * ' '
+        return f'{start}{padding}{end}'
+
+    return _SPECIFICATION_REGEX.sub(replacement, program)
@@ -5,6 +5,7 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from itertools import chain
 from typing import List, Dict, Any, Tuple
 
 from twovyper.ast import ast_nodes as ast, names
@@ -233,14 +234,14 @@ class ConstantTransformer(NodeTransformer):
         self.interpreter = ConstantInterpreter(constant_values)
 
     def _copy_pos(self, to: ast.Node, node: ast.Node) -> ast.Node:
-        to.file = node.file
-        to.lineno = node.lineno
-        to.col_offset = node.col_offset
-        to.end_lineno = node.end_lineno
-        to.end_col_offset = node.end_col_offset
-        to.is_ghost_code = node.is_ghost_code
-        for child in descendants(to):
-            self._copy_pos(child, node)
+        # Every node of the copied subtree gets the same position
+        for target in chain([to], descendants(to)):
+            target.file = node.file
+            target.lineno = node.lineno
+            target.col_offset = node.col_offset
+            target.end_lineno = node.end_lineno
+            target.end_col_offset = node.end_col_offset
+            target.is_ghost_code = node.is_ghost_code
         return to
 
     def visit_Name(self, node: ast.Name):
@@ -36,9 +36,9 @@ class CommonTranslator:
         # Inline vias are in reverse order, as the outermost is first,
         # and successive vias are appended. For the error output, changing
         # the order makes more sense.
-        inline_vias = list(reversed(ctx.inline_vias))
+        all_vias = [*reversed(ctx.inline_vias), *vias]
         values = {'function': ctx.function, **values}
-        error_info = ErrorInfo(node, inline_vias + vias, modelt, values)
+        error_info = ErrorInfo(node, all_vias, modelt, values)
         id = error_manager.add_error_information(error_info, rules)
         return id
 
@@ -53,6 +53,15 @@ class CommonTranslator:
         Extracts the position from a node, assigns an ID to the node and stores
         the node and the position in the context for it.
         """
+        if rules is None and not vias and modelt is None and not values:
+            # The registered error information only depends on the node and the context, so nodes which are
+            # translated repeatedly in the same context can share a position
+            key = (node, ctx.function, *ctx.inline_vias)
+            position = ctx.positions.get(key)
+            if position is None:
+                id = self._register_potential_error(node, ctx)
+                position = ctx.positions[key] = self.viper_ast.to_position(node, id)
+            return position
         id = self._register_potential_error(node, ctx, rules, vias, modelt, values)
         return self.viper_ast.to_position(node, id)
 
@@ -69,7 +78,7 @@ class CommonTranslator:
             return self.viper_ast.NoInfo
 
     def no_info(self) -> Info:
-        return self.to_info([])
+        return self.viper_ast.NoInfo
 
     def fail_if(self, cond: Expr, stmts: List[Stmt], res: List[Stmt], ctx: Context, pos=None, info=None):
         body = [*stmts, self.viper_ast.Goto(ctx.revert_label, pos)]
@@ -96,7 +105,7 @@ class NodeTranslator(NodeVisitor, CommonTranslator):
     def visit_nodes(self, nodes: Iterable[ast.Node], *args):
         ret = []
         for node in nodes:
-            ret += self.visit(node, *args)
+            ret.extend(self.visit(node, *args))
         return ret
 
     def generic_visit(self, node: ast.Node, *args):
@@ -47,7 +47,7 @@ class AllocationTranslator(CommonTranslator):
             type_assumptions.extend(self.type_translator.type_assumptions(var.local_var(ctx, pos), var.type, ctx))
             qvars.append(var.var_decl(ctx))
 
-        cond = reduce(lambda a, b: self.viper_ast.And(a, b, pos), type_assumptions, self.viper_ast.TrueLit(pos))
+        cond = helpers.conjunction(self.viper_ast, type_assumptions, pos)
         # TODO: select good triggers
         return self.viper_ast.Forall(qvars, [], self.viper_ast.Implies(cond, expr, pos), pos)
 
@@ -899,6 +899,10 @@ class AllocationTranslator(CommonTranslator):
             }
 
             modelt = self.model_translator.save_variables(res, ctx, pos)
+            # The success variable, the permission and the error position are the same for all predicates
+            succ = ctx.success_var.local_var(ctx, pos)
+            none = self.viper_ast.NoPerm(pos)
+            apos = self.to_position(node, ctx, rules.PERFORMS_LEAK_CHECK_FAIL, modelt=modelt)
 
             for function, arg_types in predicate_types.items():
                 # We could use forperm instead, but Carbon doesn't support multiple variables
@@ -906,12 +910,10 @@ class AllocationTranslator(CommonTranslator):
                 quant_decls = [self.viper_ast.LocalVarDecl(f'$a{idx}', t, pos) for idx, t in enumerate(arg_types)]
                 quant_vars = [decl.localVar() for decl in quant_decls]
                 pred = helpers.performs_predicate(self.viper_ast, function, quant_vars, pos)
-                succ = ctx.success_var.local_var(ctx, pos)
                 perm = self.viper_ast.CurrentPerm(pred, pos)
-                cond = self.viper_ast.Implies(succ, self.viper_ast.EqCmp(perm, self.viper_ast.NoPerm(pos), pos), pos)
+                cond = self.viper_ast.Implies(succ, self.viper_ast.EqCmp(perm, none, pos), pos)
                 trigger = self.viper_ast.Trigger([pred], pos)
                 quant = self.viper_ast.Forall(quant_decls, [trigger], cond, pos)
-                apos = self.to_position(node, ctx, rules.PERFORMS_LEAK_CHECK_FAIL, modelt=modelt)
                 res.append(self.viper_ast.Assert(quant, apos))
 
     def function_leak_check(self, res: List[Stmt], ctx: Context, pos=None):
@@ -1116,7 +1118,7 @@ class AllocationTranslator(CommonTranslator):
         # Only exhale if the address is not self and the resource is potentially an "own resource"
         address = None
         if isinstance(node, ast.FunctionCall) and node.name in names.GHOST_STATEMENTS:
-            interface_files = [ctx.program.interfaces[impl.name].file for impl in ctx.program.implements]
+            interface_files = ctx.program.implemented_interface_files()
             address, resource = self.location_address_of_performs(node, res, ctx, pos, return_resource=True)
             if resource is not None and (resource.file is None  # It is okay to declare performs for wei
                                          # It is okay to declare performs for own private resources
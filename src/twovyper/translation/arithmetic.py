@@ -14,8 +14,6 @@ from twovyper.translation import helpers
 from twovyper.translation.abstract import CommonTranslator
 from twovyper.translation.context import Context
 
-from twovyper.utils import switch
-
 from twovyper.viper.ast import ViperAST
 from twovyper.viper.typedefs import Expr, Stmt
 from twovyper.vyper import is_compatible_version
@@ -51,6 +49,17 @@ class ArithmeticTranslator(CommonTranslator):
             ast.ArithmeticOperator.POW: lambda l, r, pos: helpers.pow(viper_ast, l, r, pos),
         }
 
+        # Decimal multiplication and division have to rescale the result
+        self._decimal_ops = {
+            ast.ArithmeticOperator.MUL: self._decimal_mul,
+            ast.ArithmeticOperator.DIV: self._decimal_div
+        }
+
+        self._wrapped_decimal_ops = {
+            ast.ArithmeticOperator.MUL: self._wrapped_decimal_mul,
+            ast.ArithmeticOperator.DIV: self._wrapped_decimal_div
+        }
+
         self.non_linear_ops = {
             ast.ArithmeticOperator.MUL,
             ast.ArithmeticOperator.DIV,
@@ -123,31 +132,22 @@ class ArithmeticTranslator(CommonTranslator):
             if not right_is_wrapped:
                 right_is_wrapped = True
                 rhs = helpers.w_wrap(self.viper_ast, rhs, pos)
-        with switch(op, otype) as case:
-            from twovyper.utils import _
-
-            if (case(ast_op.DIV, _) or case(ast_op.MOD, _)) and not self.no_reverts:
-                expr = rhs
-                if right_is_wrapped:
-                    expr = helpers.w_unwrap(self.viper_ast, rhs, pos)
-                cond = self.viper_ast.EqCmp(expr, self.viper_ast.IntLit(0, pos), pos)
-                self.fail_if(cond, [], res, ctx, pos)
-
-            if left_is_wrapped and right_is_wrapped:
-                # Both are wrapped
-                if case(ast_op.MUL, types.VYPER_DECIMAL):
-                    expr = self._wrapped_decimal_mul(lhs, rhs, pos)
-                elif case(ast_op.DIV, types.VYPER_DECIMAL):
-                    expr = self._wrapped_decimal_div(lhs, rhs, pos)
-                else:
-                    expr = self._wrapped_arithmetic_ops[op](lhs, rhs, pos)
-            else:
-                if case(ast_op.MUL, types.VYPER_DECIMAL):
-                    expr = self._decimal_mul(lhs, rhs, pos)
-                elif case(ast_op.DIV, types.VYPER_DECIMAL):
-                    expr = self._decimal_div(lhs, rhs, pos)
-                else:
-                    expr = self._arithmetic_ops[op](lhs, rhs, pos)
+        if (op == ast_op.DIV or op == ast_op.MOD) and not self.no_reverts:
+            expr = rhs
+            if right_is_wrapped:
+                expr = helpers.w_unwrap(self.viper_ast, rhs, pos)
+            cond = self.viper_ast.EqCmp(expr, self.viper_ast.IntLit(0, pos), pos)
+            self.fail_if(cond, [], res, ctx, pos)
+
+        if left_is_wrapped and right_is_wrapped:
+            # Both are wrapped
+            arithmetic_ops, decimal_ops = self._wrapped_arithmetic_ops, self._wrapped_decimal_ops
+        else:
+            arithmetic_ops, decimal_ops = self._arithmetic_ops, self._decimal_ops
+        operation = decimal_ops.get(op) if otype == types.VYPER_DECIMAL else None
+        if operation is None:
+            operation = arithmetic_ops[op]
+        expr = operation(lhs, rhs, pos)
 
         if types.is_bounded(otype):
             assert isinstance(otype, BoundedType)
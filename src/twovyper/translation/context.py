@@ -106,6 +106,12 @@ class Context:
         self._inline_counter = -1
         self._current_inline = -1
         self.inline_vias = []
+        # Positions without additional error information, by node, function and inline vias
+        self.positions: Dict[tuple, Any] = {}
+        # Non-primitive types do not depend on is_local, they are translated once per Vyper type
+        self.translated_types: Dict[Any, Any] = {}
+        # Type assumptions of local variables without position, by name, Viper type, Vyper type and overflow option
+        self.type_assumptions: Dict[tuple, List[Expr]] = {}
 
         self.inside_interface_call = False
         self.inside_derived_resource_performs = False
@@ -405,7 +411,7 @@ class Context:
         self._inline_counter += 1
         self._current_inline = self._inline_counter
 
-        inline_vias = self.inline_vias.copy()
+        # Vias are only ever pushed here, so popping on exit restores them
         self.inline_vias.append(via)
 
         inside_inline_analysis = self.inside_inline_analysis
@@ -423,7 +429,7 @@ class Context:
         self.args = args
         self._current_inline = old_inline
 
-        self.inline_vias = inline_vias
+        self.inline_vias.pop()
 
         self.inside_inline_analysis = inside_inline_analysis
         self.inline_function = inline_function
@@ -475,8 +481,7 @@ class Context:
         args = None
         if self.function and not self.inside_inline_analysis:
             interfaces = [name for name, interface in old_program.interfaces.items() if interface.file == program.file]
-            implemented_interfaces = [interface.name for interface in old_program.implements]
-            if any(interface in implemented_interfaces for interface in interfaces):
+            if not old_program.implemented_interface_names.isdisjoint(interfaces):
                 args = self.args
                 other_func: VyperFunction = program.functions.get(self.function.name)
                 if other_func:
@@ -7,7 +7,7 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from functools import reduce
 from itertools import chain
-from typing import List, Optional, Tuple, Callable
+from typing import List, Optional, Tuple, Callable, Union
 
 
 from twovyper.ast import ast_nodes as ast, names, types
@@ -68,6 +68,12 @@ class ExpressionTranslator(NodeTranslator):
             ast.ComparisonOperator.GT: self.viper_ast.GtCmp
         }
 
+        self._bitwise_functions = {
+            names.BITWISE_AND: helpers.bitwise_and,
+            names.BITWISE_OR: helpers.bitwise_or,
+            names.BITWISE_XOR: helpers.bitwise_xor
+        }
+
     def translate_top_level_expression(self, node: ast.Expr, res: List[Stmt], ctx: Context):
         """
         A top level expression is an expression directly used in a statement.
@@ -109,8 +115,7 @@ class ExpressionTranslator(NodeTranslator):
         if isinstance(node.n, int):
             if node.type == types.VYPER_BYTES32:
                 bts = node.n.to_bytes(32, byteorder='big')
-                elems = [self.viper_ast.IntLit(b, pos) for b in bts]
-                return self.viper_ast.ExplicitSeq(elems, pos)
+                return self._byte_seq(bts, pos)
             else:
                 return self.viper_ast.IntLit(node.n, pos)
         elif isinstance(node.n, Decimal):
@@ -128,14 +133,17 @@ class ExpressionTranslator(NodeTranslator):
         if node.id == names.SELF and (node.type == types.VYPER_ADDRESS
                                       or isinstance(node.type, (ContractType, InterfaceType))):
             return ctx.self_address or helpers.self_address(self.viper_ast, pos)
-        elif ctx.inside_inline_analysis and node.id not in ctx.all_vars:
+
+        # ctx.all_vars chains all variable scopes on every access
+        all_vars = ctx.all_vars
+        if ctx.inside_inline_analysis and node.id not in all_vars:
             # Generate new local variable
             variable_name = node.id
             mangled_name = ctx.new_local_var_name(variable_name)
             var = TranslatedVar(variable_name, mangled_name, node.type, self.viper_ast, pos)
             ctx.locals[variable_name] = var
             ctx.new_local_vars.append(var.var_decl(ctx))
-        return ctx.all_vars[node.id].local_var(ctx, pos)
+        return all_vars[node.id].local_var(ctx, pos)
 
     def translate_ArithmeticOp(self, node: ast.ArithmeticOp, res: List[Stmt], ctx: Context) -> Expr:
         pos = self.to_position(node, ctx)
@@ -279,22 +287,24 @@ class ExpressionTranslator(NodeTranslator):
             return self.viper_ast.ExplicitSeq(elems, pos)
 
     def translate_Str(self, node: ast.Str, res: List[Stmt], ctx: Context) -> Expr:
-        pos = self.to_position(node, ctx)
-        if not node.s:
-            viper_type = self.type_translator.translate(node.type.element_type, ctx)
-            return self.viper_ast.EmptySeq(viper_type, pos)
-        else:
-            elems = [self.viper_ast.IntLit(e, pos) for e in bytes(node.s, 'utf-8')]
-            return self.viper_ast.ExplicitSeq(elems, pos)
+        return self._translate_byte_seq(node, bytes(node.s, 'utf-8'), ctx)
 
     def translate_Bytes(self, node: ast.Bytes, res: List[Stmt], ctx: Context) -> Expr:
+        return self._translate_byte_seq(node, node.s, ctx)
+
+    def _translate_byte_seq(self, node: Union[ast.Str, ast.Bytes], data: bytes, ctx: Context) -> Expr:
         pos = self.to_position(node, ctx)
-        if not node.s:
+        if not data:
             viper_type = self.type_translator.translate(node.type.element_type, ctx)
             return self.viper_ast.EmptySeq(viper_type, pos)
         else:
-            elems = [self.viper_ast.IntLit(e, pos) for e in node.s]
-            return self.viper_ast.ExplicitSeq(elems, pos)
+            return self._byte_seq(data, pos)
+
+    def _byte_seq(self, data: bytes, pos) -> Expr:
+        # Equal bytes share one literal
+        int_lit = self.viper_ast.IntLit
+        lits = {b: int_lit(b, pos) for b in set(data)}
+        return self.viper_ast.ExplicitSeq([lits[b] for b in data], pos)
 
     def translate_Tuple(self, node: ast.Tuple, res: List[Stmt], ctx: Context) -> Expr:
         pos = self.to_position(node, ctx)
@@ -354,17 +364,10 @@ class ExpressionTranslator(NodeTranslator):
             arg = self.translate(node.args[0], res, ctx)
             shift = self.translate(node.args[1], res, ctx)
             return helpers.shift(self.viper_ast, arg, shift, pos)
-        elif name in [names.BITWISE_AND, names.BITWISE_OR, names.BITWISE_XOR]:
+        elif name in self._bitwise_functions:
             a = self.translate(node.args[0], res, ctx)
             b = self.translate(node.args[1], res, ctx)
-
-            funcs = {
-                names.BITWISE_AND: helpers.bitwise_and,
-                names.BITWISE_OR: helpers.bitwise_or,
-                names.BITWISE_XOR: helpers.bitwise_xor
-            }
-
-            return funcs[name](self.viper_ast, a, b, pos)
+            return self._bitwise_functions[name](self.viper_ast, a, b, pos)
         elif name == names.BITWISE_NOT:
             arg = self.translate(node.args[0], res, ctx)
             return helpers.bitwise_not(self.viper_ast, arg, pos)
@@ -458,10 +461,8 @@ class ExpressionTranslator(NodeTranslator):
             zero = self.viper_ast.IntLit(0, pos)
             one = self.viper_ast.IntLit(1, pos)
 
-            zero_list = [0] * 32
-            one_list = [0] * 31 + [1]
-            zero_array = self.viper_ast.ExplicitSeq([self.viper_ast.IntLit(i, pos) for i in zero_list], pos)
-            one_array = self.viper_ast.ExplicitSeq([self.viper_ast.IntLit(i, pos) for i in one_list], pos)
+            zero_array = self.viper_ast.ExplicitSeq([zero] * 32, pos)
+            one_array = self.viper_ast.ExplicitSeq([zero] * 31 + [one], pos)
 
             with switch(from_type, to_type) as case:
                 from twovyper.utils import _
@@ -791,7 +792,7 @@ class ExpressionTranslator(NodeTranslator):
 
                         # Address type assumption
                         type_assumptions = self.type_translator.type_assumptions(q_var.local_var(ctx), q_var.type, ctx)
-                        type_assumptions = reduce(self.viper_ast.And, type_assumptions, self.viper_ast.TrueLit())
+                        type_assumptions = helpers.conjunction(self.viper_ast, type_assumptions)
                         expr = self.viper_ast.Implies(type_assumptions, expr, pos)
 
                         # Assertion
@@ -926,7 +927,7 @@ class ExpressionTranslator(NodeTranslator):
         address = self.viper_ast.LocalVarDecl('$a', self.viper_ast.Int)
         address_var = address.localVar()
         type_conds = self.type_translator.type_assumptions(address_var, types.VYPER_ADDRESS, ctx)
-        type_cond = reduce(lambda l, r: self.viper_ast.And(l, r, pos), type_conds, self.viper_ast.TrueLit())
+        type_cond = helpers.conjunction(self.viper_ast, type_conds, pos)
         # forall({a: address}, trusted(a, by=self, where=interface)
         #   == old(trusted(a, by=self, where=interface)))
         current_trusted = ctx.current_state[mangled.TRUSTED].local_var(ctx)
@@ -1423,11 +1424,13 @@ class ExpressionTranslator(NodeTranslator):
         if modifying:
             # Collect known interface references
             self_type = ctx.program.fields.type
-            for member_name, member_type in self_type.member_types.items():
-                viper_type = self.type_translator.translate(member_type, ctx)
-                if isinstance(member_type, types.InterfaceType):
-                    get = helpers.struct_get(self.viper_ast, ctx.self_var.local_var(ctx), member_name,
-                                             viper_type, self_type)
+            interface_members = [(member_name, member_type) for member_name, member_type
+                                 in self_type.member_types.items() if isinstance(member_type, types.InterfaceType)]
+            if interface_members:
+                self_var = ctx.self_var.local_var(ctx)
+                for member_name, member_type in interface_members:
+                    viper_type = self.type_translator.translate(member_type, ctx)
+                    get = helpers.struct_get(self.viper_ast, self_var, member_name, viper_type, self_type)
                     known_interface_ref.append((member_type.name, get))
 
             for var in chain(ctx.locals.values(), ctx.args.values()):
@@ -1462,7 +1465,8 @@ class ExpressionTranslator(NodeTranslator):
 
             caller_address = ctx.self_address or helpers.self_address(self.viper_ast)
             self.implicit_resource_caller_private_expressions(interface, to, caller_address, res, ctx)
-            res.extend(stmt for performs_as_stmts in performs_as_stmts_generators for stmt in performs_as_stmts(0))
+            for performs_as_stmts in performs_as_stmts_generators:
+                res.extend(performs_as_stmts(0))
             self.state_translator.copy_state(ctx.current_state, old_state_for_inter_contract_invariant_during, res, ctx)
 
             # Assume caller private and create new contract state
@@ -1473,7 +1477,8 @@ class ExpressionTranslator(NodeTranslator):
             self.assume_own_resources_stayed_constant(res, ctx, pos)
             self.seqn_with_info(assume_caller_private_without_receiver, "Assume caller private", res)
             self.implicit_resource_caller_private_expressions(interface, to, caller_address, res, ctx)
-            res.extend(stmt for performs_as_stmts in performs_as_stmts_generators for stmt in performs_as_stmts(1))
+            for performs_as_stmts in performs_as_stmts_generators:
+                res.extend(performs_as_stmts(1))
             self.state_translator.copy_state(ctx.current_state, ctx.current_old_state, res, ctx,
                                              unless=lambda n: n == mangled.SELF)
             self.state_translator.havoc_state(ctx.current_state, res, ctx)
@@ -1485,7 +1490,8 @@ class ExpressionTranslator(NodeTranslator):
             #  have happened, but it is before the receiver of the external call has made any re-entrant call to self. #
             ############################################################################################################
 
-            res.extend(stmt for performs_as_stmts in performs_as_stmts_generators for stmt in performs_as_stmts(-1))
+            for performs_as_stmts in performs_as_stmts_generators:
+                res.extend(performs_as_stmts(-1))
             type_ass = self.type_translator.type_assumptions(self_var, ctx.self_type, ctx)
             assume_type_ass = [self.viper_ast.Inhale(inv) for inv in type_ass]
             self.seqn_with_info(assume_type_ass, "Assume type assumptions", res)
@@ -1559,7 +1565,8 @@ class ExpressionTranslator(NodeTranslator):
             self.assume_own_resources_stayed_constant(res, ctx, pos)
             self.seqn_with_info(assume_caller_private_without_receiver, "Assume caller private", res)
             self.implicit_resource_caller_private_expressions(interface, to, caller_address, res, ctx)
-            res.extend(stmt for performs_as_stmts in performs_as_stmts_generators for stmt in performs_as_stmts(2))
+            for performs_as_stmts in performs_as_stmts_generators:
+                res.extend(performs_as_stmts(2))
 
             ############################################################################################################
             # The contract state is at the point where the external call returns. Since the last modeled public state, #
@@ -1712,17 +1719,13 @@ class ExpressionTranslator(NodeTranslator):
                 arg_var = self._translate_var(var, ctx)
                 ctx.locals[name] = arg_var
                 lhs = arg_var.local_var(ctx)
-                if (types.is_numeric(arg_var.type)
-                        and self.arithmetic_translator.is_wrapped(arg)
-                        and self.arithmetic_translator.is_unwrapped(lhs)):
-                    arg_var.is_local = False
-                    lhs = arg_var.local_var(ctx)
-                elif (types.is_numeric(arg_var.type)
-                      and self.arithmetic_translator.is_unwrapped(arg)
-                      and self.arithmetic_translator.is_wrapped(lhs)):
-                    arg = helpers.w_wrap(self.viper_ast, arg)
-                elif (not types.is_numeric(arg_var.type)
-                      and self.arithmetic_translator.is_wrapped(arg)):
+                if types.is_numeric(arg_var.type):
+                    if self.arithmetic_translator.is_wrapped(arg) and self.arithmetic_translator.is_unwrapped(lhs):
+                        arg_var.is_local = False
+                        lhs = arg_var.local_var(ctx)
+                    elif self.arithmetic_translator.is_unwrapped(arg) and self.arithmetic_translator.is_wrapped(lhs):
+                        arg = helpers.w_wrap(self.viper_ast, arg)
+                elif self.arithmetic_translator.is_wrapped(arg):
                     arg = helpers.w_unwrap(self.viper_ast, arg)
                 ctx.new_local_vars.append(arg_var.var_decl(ctx))
                 body.append(self.viper_ast.LocalVarAssign(arg_var.local_var(ctx), arg, apos))
@@ -174,10 +174,9 @@ class FunctionTranslator(CommonTranslator):
             known_interface_ref = []
             self_type = ctx.program.fields.type
             for member_name, member_type in self_type.member_types.items():
-                viper_type = self.type_translator.translate(member_type, ctx)
                 if isinstance(member_type, types.InterfaceType):
-                    get = helpers.struct_get(self.viper_ast, ctx.self_var.local_var(ctx), member_name,
-                                             viper_type, self_type)
+                    viper_type = self.type_translator.translate(member_type, ctx)
+                    get = helpers.struct_get(self.viper_ast, self_var, member_name, viper_type, self_type)
                     known_interface_ref.append((member_type.name, get))
 
             # Assume unchecked and user-specified invariants
@@ -294,7 +293,7 @@ class FunctionTranslator(CommonTranslator):
 
             # Translate the performs clauses
             performs_clause_conditions = []
-            interface_files = [ctx.program.interfaces[impl.name].file for impl in ctx.program.implements]
+            interface_files = ctx.program.implemented_interface_files()
             for performs in function.performs:
                 assert isinstance(performs, ast.FunctionCall)
                 with ctx.state_scope(ctx.pre_state, ctx.pre_state):
@@ -471,6 +470,14 @@ class FunctionTranslator(CommonTranslator):
                         post_stmts.append(self.viper_ast.Assert(cond, func_pos))
 
                 # The postconditions of the interface the contract is supposed to implement
+                if function.node:
+                    # Failing interface postconditions are reported at the function and share its positions
+                    func_post_pos = self.to_position(function.node, ctx)
+                    func_apos = self.to_position(function.node, ctx, rules.INTERFACE_POSTCONDITION_FAIL,
+                                                 modelt=model_translator)
+                else:
+                    func_post_pos = func_apos = None
+
                 for interface_type in ctx.program.implements:
                     interface = ctx.program.interfaces[interface_type.name]
                     interface_func = interface.functions.get(function.name)
@@ -480,13 +487,13 @@ class FunctionTranslator(CommonTranslator):
                         postconditions = interface.general_postconditions
 
                     for post in postconditions:
-                        post_pos = self.to_position(function.node or post, ctx)
+                        post_pos = func_post_pos or self.to_position(post, ctx)
                         with ctx.program_scope(interface):
                             cond = self.specification_translator.translate_pre_or_postcondition(post, post_stmts, ctx)
                             if is_init:
                                 cond = self.viper_ast.Implies(success_var, cond, post_pos)
-                        apos = self.to_position(function.node or post, ctx,
-                                                rules.INTERFACE_POSTCONDITION_FAIL, modelt=model_translator)
+                        apos = func_apos or self.to_position(post, ctx, rules.INTERFACE_POSTCONDITION_FAIL,
+                                                             modelt=model_translator)
                         post_assert = self.viper_ast.Assert(cond, apos)
                         post_stmts.append(post_assert)
 
@@ -602,14 +609,13 @@ class FunctionTranslator(CommonTranslator):
                 invariant_stmts.extend(assert_collected_invariants(invariant_conditions))
                 self.seqn_with_info(invariant_stmts, "Assert Inter Contract Invariants", body)
 
-                if is_init:
-                    derived_resources_invariants = [
-                        self.viper_ast.Assert(self.viper_ast.Implies(success_var, expr, expr.pos()), expr.pos())
-                        for expr in ctx.derived_resources_invariants(function.node)]
-                else:
-                    derived_resources_invariants = [
-                        self.viper_ast.Assert(expr, expr.pos())
-                        for expr in ctx.derived_resources_invariants(function.node)]
+                derived_resources_invariants = []
+                for expr in ctx.derived_resources_invariants(function.node):
+                    expr_pos = expr.pos()
+                    if is_init:
+                        # Derived resource invariants do not have to hold if __init__ fails
+                        expr = self.viper_ast.Implies(success_var, expr, expr_pos)
+                    derived_resources_invariants.append(self.viper_ast.Assert(expr, expr_pos))
                 self.seqn_with_info(derived_resources_invariants, "Assert derived resource invariants", body)
 
                 # We check that the invariant tracks all allocation by doing a leak check.
@@ -673,7 +679,7 @@ class FunctionTranslator(CommonTranslator):
 
             args_list = [arg.var_decl(ctx) for arg in args.values()]
             locals_list = [local.var_decl(ctx) for local in chain(local_vars.values(), state)]
-            locals_list = [*locals_list, *ctx.new_local_vars]
+            locals_list.extend(ctx.new_local_vars)
             ret_list = [ret.var_decl(ctx) for ret in return_variables]
 
             viper_name = mangled.method_name(function.name)
@@ -877,10 +883,8 @@ class FunctionTranslator(CommonTranslator):
 
                 self.state_translator.havoc_old_and_current_state(self.specification_translator, res, ctx, pos)
 
-            private_function_checks_conjunction = self.viper_ast.TrueLit(pos)
-            for check in function.checks:
-                cond = self.specification_translator.translate_check(check, res, ctx)
-                private_function_checks_conjunction = self.viper_ast.And(private_function_checks_conjunction, cond, pos)
+            checks = [self.specification_translator.translate_check(check, res, ctx) for check in function.checks]
+            private_function_checks_conjunction = helpers.conjunction(self.viper_ast, checks, pos)
 
             check_stmts = []
             for check in ctx.function.checks:
@@ -925,6 +929,7 @@ class FunctionTranslator(CommonTranslator):
 
     def _generate_arguments_as_local_vars(self, function, args, res, pos, ctx):
         # Add arguments to local vars, assign passed args or default argument
+        arithmetic_translator = self.expression_translator.arithmetic_translator
         for (name, var), arg in zip_longest(function.args.items(), args):
             apos = self.to_position(var.node, ctx)
             translated_arg = self._translate_var(var, ctx, True)
@@ -932,17 +937,13 @@ class FunctionTranslator(CommonTranslator):
             if not arg:
                 arg = self.expression_translator.translate(function.defaults[name], res, ctx)
             lhs = translated_arg.local_var(ctx)
-            if (types.is_numeric(translated_arg.type)
-                    and self.expression_translator.arithmetic_translator.is_wrapped(arg)
-                    and self.expression_translator.arithmetic_translator.is_unwrapped(lhs)):
-                translated_arg.is_local = False
-                lhs = translated_arg.local_var(ctx)
-            elif (types.is_numeric(translated_arg.type)
-                    and self.expression_translator.arithmetic_translator.is_unwrapped(arg)
-                    and self.expression_translator.arithmetic_translator.is_wrapped(lhs)):
-                arg = helpers.w_wrap(self.viper_ast, arg)
-            elif (not types.is_numeric(translated_arg.type)
-                    and self.expression_translator.arithmetic_translator.is_wrapped(arg)):
+            if types.is_numeric(translated_arg.type):
+                if arithmetic_translator.is_wrapped(arg) and arithmetic_translator.is_unwrapped(lhs):
+                    translated_arg.is_local = False
+                    lhs = translated_arg.local_var(ctx)
+                elif arithmetic_translator.is_unwrapped(arg) and arithmetic_translator.is_wrapped(lhs):
+                    arg = helpers.w_wrap(self.viper_ast, arg)
+            elif arithmetic_translator.is_wrapped(arg):
                 arg = helpers.w_unwrap(self.viper_ast, arg)
             ctx.new_local_vars.append(translated_arg.var_decl(ctx, pos))
             res.append(self.viper_ast.LocalVarAssign(lhs, arg, apos))
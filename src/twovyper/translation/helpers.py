@@ -19,8 +19,6 @@ from twovyper.translation import mangled
 from twovyper.translation.context import Context
 from twovyper.translation.wrapped_viper_ast import WrappedViperAST, wrapped_integer_decorator
 
-from twovyper.utils import first_index
-
 from twovyper.viper.typedefs import Expr
 
 
@@ -192,7 +190,7 @@ def self_address(viper_ast: ViperAST, pos=None, info=None):
 def implements(viper_ast: ViperAST, address, interface: str, ctx: Context, pos=None, info=None):
     impl = mangled.IMPLEMENTS
     domain = mangled.CONTRACT_DOMAIN
-    intf = viper_ast.IntLit(first_index(lambda i: i == interface, ctx.program.interfaces), pos)
+    intf = viper_ast.IntLit(ctx.program.interface_indices.get(interface, -1), pos)
     return viper_ast.DomainFuncApp(impl, [address, intf], viper_ast.Bool, pos, info, domain)
 
 
@@ -581,38 +579,69 @@ def havoc_var(viper_ast: ViperAST, viper_type, ctx: Context):
 
 
 def flattened_conditional(viper_ast: ViperAST, cond, thn, els, pos=None):
-    res = []
-
     if_class = viper_ast.ast.If
     seqn_class = viper_ast.ast.Seqn
     assign_class = viper_ast.ast.LocalVarAssign
-    assume_or_check_stmts = [viper_ast.ast.Inhale, viper_ast.ast.Assert, viper_ast.ast.Exhale]
-    supported_classes = [*assume_or_check_stmts, if_class, seqn_class, assign_class]
-    if all(stmt.__class__ in supported_classes for stmt in thn + els):
-        not_cond = viper_ast.Not(cond, pos)
-        thn = [(stmt, cond) for stmt in thn]
-        els = [(stmt, not_cond) for stmt in els]
-        for stmt, cond in thn + els:
+    assume_or_check_stmts = {viper_ast.ast.Inhale, viper_ast.ast.Assert, viper_ast.ast.Exhale}
+    supported_classes = {*assume_or_check_stmts, if_class, seqn_class, assign_class}
+
+    def is_supported(stmts):
+        return all(stmt.__class__ in supported_classes for stmt in stmts)
+
+    # Appends the flattened statements of all nested branches to res
+    def flatten(branch_cond, stmts, res):
+        for stmt in stmts:
             stmt_class = stmt.__class__
             if stmt_class in assume_or_check_stmts:
-                implies = viper_ast.Implies(cond, stmt.exp(), stmt.pos())
+                implies = viper_ast.Implies(branch_cond, stmt.exp(), stmt.pos())
                 res.append(stmt_class(implies, stmt.pos(), stmt.info(), stmt.errT()))
             elif stmt_class == assign_class:
-                cond_expr = viper_ast.CondExp(cond, stmt.rhs(), stmt.lhs(), stmt.pos())
+                cond_expr = viper_ast.CondExp(branch_cond, stmt.rhs(), stmt.lhs(), stmt.pos())
                 res.append(viper_ast.LocalVarAssign(stmt.lhs(), cond_expr, stmt.pos()))
             elif stmt_class == if_class:
-                new_cond = viper_ast.And(stmt.cond(), cond, stmt.pos())
-                stmts = viper_ast.to_list(stmt.thn().ss())
-                res.extend(flattened_conditional(viper_ast, new_cond, stmts, [], stmt.pos()))
-                new_cond = viper_ast.And(viper_ast.Not(stmt.cond(), stmt.pos()), cond, stmt.pos())
-                stmts = viper_ast.to_list(stmt.els().ss())
-                res.extend(flattened_conditional(viper_ast, new_cond, stmts, [], stmt.pos()))
+                # Most ifs have no else branch, only build the branch conditions of non-empty branches
+                thn_stmts = viper_ast.to_list(stmt.thn().ss())
+                if thn_stmts:
+                    new_cond = viper_ast.And(stmt.cond(), branch_cond, stmt.pos())
+                    flatten_branch(new_cond, thn_stmts, res, stmt.pos())
+                els_stmts = viper_ast.to_list(stmt.els().ss())
+                if els_stmts:
+                    new_cond = viper_ast.And(viper_ast.Not(stmt.cond(), stmt.pos()), branch_cond, stmt.pos())
+                    flatten_branch(new_cond, els_stmts, res, stmt.pos())
             elif stmt_class == seqn_class:
-                seqn_as_list = viper_ast.to_list(stmt.ss())
-                transformed_stmts = flattened_conditional(viper_ast, cond, seqn_as_list, [], stmt.pos())
+                transformed_stmts = []
+                flatten_branch(branch_cond, viper_ast.to_list(stmt.ss()), transformed_stmts, stmt.pos())
                 res.append(viper_ast.Seqn(transformed_stmts, stmt.pos(), stmt.info()))
             else:
                 assert False
+
+    def flatten_branch(branch_cond, stmts, res, branch_pos):
+        if is_supported(stmts):
+            flatten(branch_cond, stmts, res)
+        else:
+            res.append(viper_ast.If(branch_cond, stmts, [], branch_pos))
+
+    result = []
+    if is_supported(thn) and is_supported(els):
+        flatten(cond, thn, result)
+        if els:
+            flatten(viper_ast.Not(cond, pos), els, result)
     else:
-        res.append(viper_ast.If(cond, thn, [], pos))
-    return res
+        result.append(viper_ast.If(cond, thn, [], pos))
+    return result
+
+
+def conjunction(viper_ast: ViperAST, exprs, pos=None, info=None):
+    """
+    Conjoins the given expressions as a balanced tree of depth O(log n), or `true` if there are none.
+    """
+    exprs = list(exprs)
+    if not exprs:
+        return viper_ast.TrueLit(pos, info)
+
+    while len(exprs) > 1:
+        paired = [viper_ast.And(left, right, pos, info) for left, right in zip(exprs[::2], exprs[1::2])]
+        if len(exprs) % 2:
+            paired.append(exprs[-1])
+        exprs = paired
+    return exprs[0]
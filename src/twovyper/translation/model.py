@@ -54,12 +54,13 @@ class ModelTranslator(CommonTranslator):
             res.append(self.viper_ast.LocalVarAssign(new_var.localVar(), rhs, pos))
 
         def add_struct_members(struct, struct_type, components, wrapped=None):
+            # components is the path to the current member, each member is pushed while it is visited
             for member, member_type in struct_type.member_types.items():
-                new_components = components + [member]
+                components.append(member)
                 mtype = self.type_translator.translate(member_type, ctx)
                 get = helpers.struct_get(self.viper_ast, struct, member, mtype, struct_type, pos)
                 if isinstance(member_type, StructType):
-                    add_struct_members(get, member_type, new_components, wrapped)
+                    add_struct_members(get, member_type, components, wrapped)
                 else:
                     if member == mangled.SELFDESTRUCT_FIELD:
                         name = f'{names.SELFDESTRUCT}()'
@@ -68,12 +69,13 @@ class ModelTranslator(CommonTranslator):
                     elif member == mangled.RECEIVED_FIELD:
                         name = f'{names.RECEIVED}()'
                     else:
-                        name = '.'.join(new_components)
+                        name = '.'.join(components)
 
                     if wrapped:
                         name = wrapped(name)
 
-                    add_model_var(name, member_type, get, new_components)
+                    add_model_var(name, member_type, get, components)
+                components.pop()
 
         add_struct_members(self_var, ctx.program.type, [names.SELF])
         add_struct_members(old_self_var, ctx.program.type, [names.SELF], lambda n: f'{names.OLD}({n})')
@@ -5,7 +5,6 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from functools import reduce
 from itertools import chain
 from typing import List
 
@@ -86,25 +85,21 @@ class PureFunctionTranslator(PureTranslatorMixin, FunctionTranslator):
             viper_struct_type = helpers.struct_type(self.viper_ast)
             function_result = self.viper_ast.Result(viper_struct_type)
 
-            def partial_unfinished_cond_expression(cond_and_idx):
-                cond, idx = cond_and_idx
-
-                def unfinished_cond_expression(expr):
+            def cond_expression_chain(conds_and_idxs, viper_type, default):
+                # Fold the assignments into nested conditional expressions, the first assignment is the outermost
+                value = default
+                for cond, idx in reversed(conds_and_idxs):
                     val = helpers.struct_get_idx(self.viper_ast, function_result, idx, viper_type, pos)
-                    return self.viper_ast.CondExp(cond, val, expr)
-
-                return unfinished_cond_expression
+                    value = self.viper_ast.CondExp(cond, val, value)
+                return value
 
             # Generate success variable
             viper_type = self.viper_ast.Bool
-            unfinished_cond_expressions = list(map(partial_unfinished_cond_expression, ctx.pure_success))
-            value = reduce(lambda expr, func: func(expr), reversed(unfinished_cond_expressions),
-                           self.viper_ast.TrueLit())
+            value = cond_expression_chain(ctx.pure_success, viper_type, self.viper_ast.TrueLit())
             # Set success variable at slot 0
             success_var = helpers.struct_pure_get_success(self.viper_ast, function_result, pos)
-            success_cond_expr = self.viper_ast.CondExp(value,
-                                                       self.viper_ast.TrueLit(), self.viper_ast.FalseLit())
-            body.append(self.viper_ast.EqCmp(success_var, success_cond_expr))
+            # The value already is a boolean, it does not have to be converted with a conditional expression
+            body.append(self.viper_ast.EqCmp(success_var, value))
 
             # Generate result variable
             viper_type = self.viper_ast.Bool
@@ -112,8 +107,7 @@ class PureFunctionTranslator(PureTranslatorMixin, FunctionTranslator):
             if function.type.return_type:
                 viper_type = self.type_translator.translate(function.type.return_type, ctx)
                 default_value = self.type_translator.default_value(function.node, function.type.return_type, body, ctx)
-            unfinished_cond_expressions = list(map(partial_unfinished_cond_expression, ctx.pure_returns))
-            value = reduce(lambda expr, func: func(expr), reversed(unfinished_cond_expressions), default_value)
+            value = cond_expression_chain(ctx.pure_returns, viper_type, default_value)
             # Set result variable at slot 1
             result_var = helpers.struct_pure_get_result(self.viper_ast, function_result, viper_type, pos)
             body.append(self.viper_ast.EqCmp(result_var, value))
@@ -131,7 +125,7 @@ class PureFunctionTranslator(PureTranslatorMixin, FunctionTranslator):
                     rhs = new_arg.local_var(ctx)
                     arg_transform.append(self.viper_ast.EqCmp(lhs, rhs))
                     new_args[arg_name] = new_arg
-            body = arg_transform + body
+            body[:0] = arg_transform
             args_list = [arg.var_decl(ctx) for arg in chain(state.values(), new_args.values())]
 
             viper_name = mangled.pure_function_name(function.name)
@@ -39,10 +39,6 @@ class PureStatementTranslator(PureTranslatorMixin, StatementTranslator):
         if not node.is_ghost_code:
             super().visit(node, *args)
 
-    def translate_stmts(self, stmts: List[ast.Stmt], res: List[Expr], ctx: Context):
-        for s in stmts:
-            self.translate(s, res, ctx)
-
     def translate_AnnAssign(self, node: ast.AnnAssign, res: List[Expr], ctx: Context):
         pos = self.to_position(node, ctx)
 
@@ -108,11 +104,15 @@ class PureStatementTranslator(PureTranslatorMixin, StatementTranslator):
         pos = self.to_position(node, ctx)
         cond = self.expression_translator.translate(node.test, res, ctx)
 
-        cond_var = TranslatedPureIndexedVar('cond', 'cond', VYPER_BOOL, self.viper_ast, pos)
-        assign = self.viper_ast.EqCmp(cond_var.local_var(ctx), cond, pos)
-        expr = self.viper_ast.Implies(ctx.pure_conds, assign, pos) if ctx.pure_conds else assign
-        res.append(expr)
-        cond_local_var = cond_var.local_var(ctx)
+        if isinstance(node.test, (ast.Name, ast.Bool)):
+            # Every index of a pure variable is assigned only once, so variables and literals can be used directly
+            cond_local_var = cond
+        else:
+            cond_var = TranslatedPureIndexedVar('cond', 'cond', VYPER_BOOL, self.viper_ast, pos)
+            assign = self.viper_ast.EqCmp(cond_var.local_var(ctx), cond, pos)
+            expr = self.viper_ast.Implies(ctx.pure_conds, assign, pos) if ctx.pure_conds else assign
+            res.append(expr)
+            cond_local_var = cond_var.local_var(ctx)
 
         # "Then" branch
         with ctx.new_local_scope():
@@ -302,20 +302,32 @@ class PureStatementTranslator(PureTranslatorMixin, StatementTranslator):
         ctx.locals[variable_name] = var
 
     def _xor_conds(self, conds: List[Expr]) -> Optional[Expr]:
+        if len(conds) == 1:
+            return conds[0]
+        # Every condition is negated in all but one disjunct, the disjuncts share the conjunctions of the
+        # negations before and after their condition
+        negated_conds = [self.viper_ast.Not(cond) for cond in conds]
+        prefixes = [None]
+        for negated_cond in negated_conds[:-1]:
+            prev = prefixes[-1]
+            prefixes.append(self.viper_ast.And(prev, negated_cond) if prev else negated_cond)
+        suffixes = [None]
+        for negated_cond in reversed(negated_conds[1:]):
+            prev = suffixes[-1]
+            suffixes.append(self.viper_ast.And(negated_cond, prev) if prev else negated_cond)
+        suffixes.reverse()
         xor_cond = None
-        for i in range(len(conds)):
-            prev = None
-            for idx, cond in enumerate(conds):
-                and_cond = cond if idx == i else self.viper_ast.Not(cond)
-                prev = self.viper_ast.And(prev, and_cond) if prev else and_cond
-            xor_cond = self.viper_ast.Or(xor_cond, prev) if xor_cond else prev
+        for prefix, cond, suffix in zip(prefixes, conds, suffixes):
+            and_cond = self.viper_ast.And(prefix, cond) if prefix else cond
+            and_cond = self.viper_ast.And(and_cond, suffix) if suffix else and_cond
+            xor_cond = self.viper_ast.Or(xor_cond, and_cond) if xor_cond else and_cond
         return xor_cond
 
     @staticmethod
     def _local_variable_snapshot(ctx) -> LocalVarSnapshot:
-        return dict(((name, (var.evaluate_idx(ctx), var.local_var(ctx), var.is_local))
-                     for name, var in ctx.locals.items()
-                     if isinstance(var, TranslatedPureIndexedVar)))
+        return {name: (var.evaluate_idx(ctx), var.local_var(ctx), var.is_local)
+                for name, var in ctx.locals.items()
+                if isinstance(var, TranslatedPureIndexedVar)}
 
     @staticmethod
     def _reset_variable_to_snapshot(snapshot: LocalVarSnapshot, ctx):
@@ -327,8 +339,8 @@ class PureStatementTranslator(PureTranslatorMixin, StatementTranslator):
     def _merge_snapshots(self, merge_cond: Optional[Expr], first_snapshot: LocalVarSnapshot,
                          second_snapshot: LocalVarSnapshot, res: List[Expr], ctx: Context) -> LocalVarSnapshot:
         res_snapshot = {}
-        names = set(first_snapshot.keys()) | set(second_snapshot.keys())
-        for name in names:
+        cond = merge_cond or self.viper_ast.TrueLit()
+        for name in first_snapshot.keys() | second_snapshot.keys():
             first_idx_and_var = first_snapshot.get(name)
             second_idx_and_var = second_snapshot.get(name)
             if first_idx_and_var and second_idx_and_var:
@@ -339,7 +351,6 @@ class PureStatementTranslator(PureTranslatorMixin, StatementTranslator):
                 if else_idx != then_idx:
                     var.new_idx()
                     var.is_local = then_is_local and else_is_local
-                    cond = merge_cond or self.viper_ast.TrueLit()
                     expr = self.viper_ast.CondExp(cond, then_var, else_var)
                     assign = self.viper_ast.EqCmp(var.local_var(ctx), expr)
                     res.append(assign)
@@ -5,7 +5,6 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from functools import reduce
 from typing import List, Optional, Tuple, Union
 
 from twovyper.ast import ast_nodes as ast, names, types
@@ -78,7 +77,7 @@ class ResourceTranslator(NodeTranslator):
                 arg_var = arg.localVar()
                 type_assumptions.extend(self.specification_translator.type_translator
                                         .type_assumptions(arg_var, arg_type, ctx))
-            type_cond = reduce(lambda l, r: self.viper_ast.And(l, r, pos), type_assumptions, self.viper_ast.TrueLit())
+            type_cond = helpers.conjunction(self.viper_ast, type_assumptions, pos)
             if translate_underlying:
                 assert isinstance(resource.type, types.DerivedResourceType)
                 if resource.name == names.WEI:
@@ -7,11 +7,11 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 from collections import ChainMap
 from contextlib import contextmanager
 from functools import reduce
-from itertools import chain, starmap, zip_longest
+from itertools import chain, islice, starmap
 from typing import List, Optional, Iterable
 
 from twovyper.ast import ast_nodes as ast, names, types
-from twovyper.ast.nodes import VyperInterface
+from twovyper.ast.nodes import VyperFunction, VyperInterface
 from twovyper.ast.types import VyperType
 from twovyper.ast.visitors import NodeVisitor
 
@@ -172,11 +172,7 @@ class SpecificationTranslator(ExpressionTranslator):
                 viper_result_type = self.type_translator.translate(func.type.return_type, ctx)
                 mangled_name = mangled.pure_function_name(call.name)
                 pos = self.to_position(call, ctx, rules=rules.PURE_FUNCTION_FAIL, values={'function': func})
-                function_args = call.args.copy()
-                for (name, _), arg in zip_longest(func.args.items(), call.args):
-                    if not arg:
-                        function_args.append(func.defaults[name])
-                args = [self.translate(arg, res, ctx) for arg in [call.receiver] + function_args]
+                args = self._translate_pure_call_args(call, func, res, ctx)
                 func_app = self.viper_ast.FuncApp(mangled_name, args, pos,
                                                   type=helpers.struct_type(self.viper_ast))
                 result_func_app = self.viper_ast.FuncApp(mangled.PURE_RESULT, [func_app], pos, type=self.viper_ast.Int)
@@ -246,11 +242,7 @@ class SpecificationTranslator(ExpressionTranslator):
                 assert isinstance(call, ast.ReceiverCall)
                 func = ctx.program.functions[call.name]
                 mangled_name = mangled.pure_function_name(call.name)
-                function_args = call.args.copy()
-                for (name, _), arg in zip_longest(func.args.items(), call.args):
-                    if not arg:
-                        function_args.append(func.defaults[name])
-                args = [self.translate(arg, res, ctx) for arg in [call.receiver] + function_args]
+                args = self._translate_pure_call_args(call, func, res, ctx)
                 func_app = self.viper_ast.FuncApp(mangled_name, args, pos,
                                                   type=helpers.struct_type(self.viper_ast))
                 success = self.viper_ast.FuncApp(mangled.PURE_SUCCESS, [func_app], pos, type=self.viper_ast.Bool)
@@ -482,8 +474,10 @@ class SpecificationTranslator(ExpressionTranslator):
                     get = lambda m, t: helpers.struct_get(self.viper_ast, ref, m, tt(t), struct_type, pos)
                     members = struct_type.member_types.items()
                     gets = [get(member, member_type) for member, member_type in members if member != node.attr]
-                    lows = [self.viper_ast.Low(get, position=pos) for get in gets]
-                    return unless(node.value) + lows
+                    # The list returned for the prefix is not shared and can be extended
+                    lows = unless(node.value)
+                    lows.extend(self.viper_ast.Low(get, position=pos) for get in gets)
+                    return lows
                 elif isinstance(node, ast.Name):
                     variables = [ctx.old_self_var, ctx.msg_var, ctx.block_var, ctx.chain_var, ctx.tx_var, *ctx.args.values()]
                     return [self.viper_ast.Low(var.local_var(ctx, pos), position=pos) for var in variables if var.name != node.id]
@@ -566,16 +560,17 @@ class SpecificationTranslator(ExpressionTranslator):
         else:
             assert False
 
+    def _translate_pure_call_args(self, call: ast.ReceiverCall, func: VyperFunction, res: List[Stmt], ctx: Context):
+        # Arguments that are not passed take the default value of the function
+        defaults = (func.defaults[name] for name in islice(func.args, len(call.args), None))
+        return [self.translate(arg, res, ctx) for arg in chain([call.receiver], call.args, defaults)]
+
     def _translate_pure_success(self, node, res, ctx, pos=None):
         call = node.args[0]
         assert isinstance(call, ast.ReceiverCall)
         func = ctx.program.functions[call.name]
         mangled_name = mangled.pure_function_name(call.name)
-        function_args = call.args.copy()
-        for (name, _), arg in zip_longest(func.args.items(), call.args):
-            if not arg:
-                function_args.append(func.defaults[name])
-        args = [self.translate(arg, res, ctx) for arg in [call.receiver] + function_args]
+        args = self._translate_pure_call_args(call, func, res, ctx)
         func_app = self.viper_ast.FuncApp(mangled_name, args, pos,
                                           type=helpers.struct_type(self.viper_ast))
         return self.viper_ast.FuncApp(mangled.PURE_SUCCESS, [func_app], pos, type=self.viper_ast.Bool)
@@ -661,7 +656,7 @@ class SpecificationTranslator(ExpressionTranslator):
                 qtlocals[i].append(local)
                 type_assumptions[i].extend(self.type_translator.type_assumptions(local, var.type, ctx))
 
-        tas = reduce(lambda a, b: self.viper_ast.And(a, b, pos), chain(*type_assumptions), true)
+        tas = reduce(lambda a, b: self.viper_ast.And(a, b, pos), chain.from_iterable(type_assumptions), true)
 
         or_op = lambda a, b: self.viper_ast.Or(a, b, pos)
         ne_op = lambda a, b: self.viper_ast.NeCmp(a, b, pos)
@@ -687,7 +682,7 @@ class SpecificationTranslator(ExpressionTranslator):
             arg_neq = self.viper_ast.Or(arg_neq, reduce(or_op, is_zero), pos)
 
         expr = self.viper_ast.Implies(tas, self.viper_ast.Implies(cond, arg_neq, pos), pos)
-        quant = self.viper_ast.Forall([var.var_decl(ctx) for var in chain(*qtvars)], [], expr, pos)
+        quant = self.viper_ast.Forall([var.var_decl(ctx) for var in chain.from_iterable(qtvars)], [], expr, pos)
 
         modelt = self.model_translator.save_variables(res, ctx, pos)
 
@@ -56,8 +56,9 @@ class StatementTranslator(NodeTranslator):
         self.type_translator = TypeTranslator(viper_ast)
 
     def translate_stmts(self, stmts: List[ast.Stmt], res: List[Stmt], ctx: Context):
+        visit = self.visit
         for s in stmts:
-            self.translate(s, res, ctx)
+            visit(s, res, ctx)
 
     def translate_AnnAssign(self, node: ast.AnnAssign, res: List[Stmt], ctx: Context):
         pos = self.to_position(node, ctx)
@@ -241,16 +242,13 @@ class StatementTranslator(NodeTranslator):
                 set_loop_var = self.viper_ast.LocalVarAssign(loop_var, array_at, lpos)
                 self.seqn_with_info([assume_base_case, set_loop_var],
                                     "Base case: Known property about loop variable", stmts)
+                loop_invariant_stmts = []
                 with ctx.state_scope(ctx.current_state, ctx.current_state):
                     # Loop Invariants are translated the same as pre- or postconditions
-                    translated_loop_invariant_asserts = \
-                        [(loop_invariant,
-                          self.specification_translator.translate_pre_or_postcondition(loop_invariant, stmts, ctx))
-                         for loop_invariant in loop_invariants]
-                loop_invariant_stmts = []
-                for loop_invariant, cond in translated_loop_invariant_asserts:
-                    cond_pos = self.to_position(loop_invariant, ctx, rules.LOOP_INVARIANT_BASE_FAIL)
-                    loop_invariant_stmts.append(self.viper_ast.Exhale(cond, cond_pos))
+                    for loop_invariant in loop_invariants:
+                        cond = self.specification_translator.translate_pre_or_postcondition(loop_invariant, stmts, ctx)
+                        cond_pos = self.to_position(loop_invariant, ctx, rules.LOOP_INVARIANT_BASE_FAIL)
+                        loop_invariant_stmts.append(self.viper_ast.Exhale(cond, cond_pos))
                 self.seqn_with_info(loop_invariant_stmts, "Check loop invariants before iteration 0", stmts)
 
                 # Step case
@@ -321,18 +319,15 @@ class StatementTranslator(NodeTranslator):
                 self.seqn_with_info([assume_step_case, set_loop_var],
                                     "Step case: Known property about loop variable", stmts)
 
+                loop_invariant_stmts = []
                 with ctx.old_local_variables_scope(loop_used_var):
                     with ctx.state_scope(ctx.current_state, pre_state_of_loop):
                         # Translate the loop invariants with assume-events-flag
-                        translated_loop_invariant_assumes = \
-                            [(loop_invariant,
-                              self.specification_translator
-                              .translate_pre_or_postcondition(loop_invariant, stmts, ctx, assume_events=True))
-                             for loop_invariant in loop_invariants]
-                loop_invariant_stmts = []
-                for loop_invariant, cond_inhale in translated_loop_invariant_assumes:
-                    cond_pos = self.to_position(loop_invariant, ctx, rules.INHALE_LOOP_INVARIANT_FAIL)
-                    loop_invariant_stmts.append(self.viper_ast.Inhale(cond_inhale, cond_pos))
+                        for loop_invariant in loop_invariants:
+                            cond_inhale = self.specification_translator\
+                                .translate_pre_or_postcondition(loop_invariant, stmts, ctx, assume_events=True)
+                            cond_pos = self.to_position(loop_invariant, ctx, rules.INHALE_LOOP_INVARIANT_FAIL)
+                            loop_invariant_stmts.append(self.viper_ast.Inhale(cond_inhale, cond_pos))
                 self.seqn_with_info(loop_invariant_stmts, "Assume loop invariants", stmts)
                 with ctx.break_scope():
                     with ctx.continue_scope():
@@ -356,19 +351,15 @@ class StatementTranslator(NodeTranslator):
                             array_at = helpers.w_wrap(self.viper_ast, array_at, rpos)
                         stmts.append(self.viper_ast.LocalVarAssign(loop_var, array_at, lpos))
                         # Check loop invariants
+                        loop_invariant_stmts = []
                         with ctx.old_local_variables_scope(loop_used_var):
                             with ctx.state_scope(ctx.current_state, pre_state_of_loop):
                                 # Re-translate the loop invariants since the context might have changed
-                                translated_loop_invariant_asserts = \
-                                    [(loop_invariant,
-                                      self.specification_translator.translate_pre_or_postcondition(loop_invariant,
-                                                                                                   stmts, ctx))
-                                     for loop_invariant in loop_invariants]
-                        loop_invariant_stmts = []
-                        for loop_invariant, cond in translated_loop_invariant_asserts:
-                            cond_pos = self.to_position(loop_invariant, ctx,
-                                                        rules.LOOP_INVARIANT_STEP_FAIL)
-                            loop_invariant_stmts.append(self.viper_ast.Exhale(cond, cond_pos))
+                                for loop_invariant in loop_invariants:
+                                    cond = self.specification_translator\
+                                        .translate_pre_or_postcondition(loop_invariant, stmts, ctx)
+                                    cond_pos = self.to_position(loop_invariant, ctx, rules.LOOP_INVARIANT_STEP_FAIL)
+                                    loop_invariant_stmts.append(self.viper_ast.Exhale(cond, cond_pos))
                         self.seqn_with_info(loop_invariant_stmts, "Check loop invariants for iteration idx + 1", stmts)
                         # Kill this branch
                         stmts.append(self.viper_ast.Inhale(self.viper_ast.FalseLit(), pos))
@@ -5,14 +5,13 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from functools import reduce
 from itertools import chain
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from twovyper import resources
 from twovyper.translation.lemma import LemmaTranslator
 
-from twovyper.utils import flatten, seq_to_list
+from twovyper.utils import seq_to_list
 
 from twovyper.ast import names, types, ast_nodes as ast
 from twovyper.ast.nodes import VyperProgram, VyperEvent, VyperStruct, VyperFunction, GhostFunction, Resource
@@ -40,7 +39,7 @@ from twovyper.viper import sif
 from twovyper.viper.ast import ViperAST
 from twovyper.viper.jvmaccess import JVM
 from twovyper.viper.parser import ViperParser
-from twovyper.viper.typedefs import Program, Stmt
+from twovyper.viper.typedefs import Domain, Function, Method, Predicate, Program, Stmt, Type
 
 
 class TranslationOptions:
@@ -51,6 +50,9 @@ class TranslationOptions:
 
 
 builtins: Optional[Program] = None
+# The members of the built-in program, every translated program starts with a copy of them
+BuiltinMembers = Tuple[List[Method], List[Domain], List[Function], List[Predicate]]
+builtin_members: Optional[BuiltinMembers] = None
 
 
 def translate(vyper_program: VyperProgram, options: TranslationOptions, jvm: JVM) -> Program:
@@ -63,11 +65,14 @@ def translate(vyper_program: VyperProgram, options: TranslationOptions, jvm: JVM
     if vyper_program.is_interface():
         return viper_ast.Program([], [], [], [], [])
 
-    global builtins
+    global builtins, builtin_members
     if builtins is None:
         viper_parser = ViperParser(jvm)
         builtins = viper_parser.parse(*resources.viper_all())
-    translator = ProgramTranslator(viper_ast, builtins)
+        # The members of the built-in program as Python lists, shared by all translated programs
+        builtin_members = (seq_to_list(builtins.methods()), seq_to_list(builtins.domains()),
+                           seq_to_list(builtins.functions()), seq_to_list(builtins.predicates()))
+    translator = ProgramTranslator(viper_ast, builtin_members)
 
     viper_program = translator.translate(vyper_program, options)
     if options.check_ast_inconsistencies:
@@ -82,7 +87,7 @@ def translate(vyper_program: VyperProgram, options: TranslationOptions, jvm: JVM
 
 class ProgramTranslator(CommonTranslator):
 
-    def __init__(self, viper_ast: ViperAST, twovyper_builtins: Program):
+    def __init__(self, viper_ast: ViperAST, twovyper_builtins: BuiltinMembers):
         viper_ast = WrappedViperAST(viper_ast)
         super().__init__(viper_ast)
         self.builtins = twovyper_builtins
@@ -100,14 +105,15 @@ class ProgramTranslator(CommonTranslator):
         if names.INIT not in vyper_program.functions:
             vyper_program.functions[mangled.INIT] = helpers.init_function()
 
+        builtin_methods, builtin_domains, builtin_functions, builtin_predicates = self.builtins
         # Add built-in methods
-        methods = seq_to_list(self.builtins.methods())
+        methods = list(builtin_methods)
         # Add built-in domains
-        domains = seq_to_list(self.builtins.domains())
+        domains = list(builtin_domains)
         # Add built-in functions
-        functions = seq_to_list(self.builtins.functions())
+        functions = list(builtin_functions)
         # Add built-in predicates
-        predicates = seq_to_list(self.builtins.predicates())
+        predicates = list(builtin_predicates)
 
         # Add self.$sent field
         sent_type = types.MapType(types.VYPER_ADDRESS, types.NON_NEGATIVE_INT)
@@ -127,12 +133,12 @@ class ProgramTranslator(CommonTranslator):
         ctx.current_program = vyper_program
         ctx.options = options
 
-        # Translate self
-        domains.append(self._translate_struct(vyper_program.fields, ctx))
-
         for field, field_type in vyper_program.fields.type.member_types.items():
             ctx.field_types[field] = self.type_translator.translate(field_type, ctx)
 
+        # Translate self, reusing the already translated field types
+        domains.append(self._translate_struct(vyper_program.fields, ctx, ctx.field_types))
+
         # Add the offer struct which we use as the key type of the offered map
         if ctx.program.config.has_option(names.CONFIG_ALLOCATION):
             offer_struct = VyperStruct(mangled.OFFER, helpers.offer_type(), None)
@@ -147,15 +153,16 @@ class ProgramTranslator(CommonTranslator):
             offered = ctx.current_state[mangled.OFFERED].local_var(ctx)
 
             self_address = ctx.self_address or helpers.self_address(self.viper_ast)
+            zero = self.viper_ast.IntLit(0)
 
             own_derived_resources = [(name, resource) for name, resource in ctx.program.own_resources.items()
                                      if isinstance(resource.type, types.DerivedResourceType)]
-            translated_own_derived_resources = self.resource_translator\
-                .translate_resources_for_quantified_expr(own_derived_resources, ctx)
+            # There is one translated resource per derived resource, so their number is enough to start the
+            # argument indices after them
             translated_own_underlying_resources = self.resource_translator\
                 .translate_resources_for_quantified_expr(own_derived_resources, ctx,
                                                          translate_underlying=True,
-                                                         args_idx_start=len(translated_own_derived_resources))
+                                                         args_idx_start=len(own_derived_resources))
 
             for index, (name, resource) in enumerate(own_derived_resources):
                 if name == names.WEI:
@@ -181,8 +188,7 @@ class ProgramTranslator(CommonTranslator):
                 # resource.underlying_address is constant once set
                 pos = self.to_position(pos_node, ctx, rules.UNDERLYING_ADDRESS_CONSTANT_FAIL,
                                        values={'resource': resource})
-                old_underlying_address_neq_zero = self.viper_ast.NeCmp(t_old_underlying_address,
-                                                                       self.viper_ast.IntLit(0), pos)
+                old_underlying_address_neq_zero = self.viper_ast.NeCmp(t_old_underlying_address, zero, pos)
                 underlying_address_eq = self.viper_ast.EqCmp(t_underlying_address, t_old_underlying_address, pos)
                 underlying_address_const = self.viper_ast.Implies(old_underlying_address_neq_zero,
                                                                   underlying_address_eq, pos)
@@ -266,7 +272,7 @@ class ProgramTranslator(CommonTranslator):
         domains.extend(self._translate_struct(struct, ctx) for struct in structs)
 
         # Resources
-        all_resources = flatten(vyper_program.resources.values())
+        all_resources = chain.from_iterable(vyper_program.resources.values())
         domains.extend(self._translate_struct(resource, ctx) for resource in all_resources)
         domains.append(self._translate_struct(helpers.creator_resource(), ctx))
 
@@ -277,16 +283,17 @@ class ProgramTranslator(CommonTranslator):
 
         # Pure functions
         pure_vyper_functions = filter(VyperFunction.is_pure,  vyper_program.functions.values())
-        functions += [self.pure_function_translator.translate(function, ctx) for function in pure_vyper_functions]
+        functions.extend(self.pure_function_translator.translate(function, ctx) for function in pure_vyper_functions)
 
         # Lemmas
-        functions += [function for lemma in vyper_program.lemmas.values()
-                      for function in self.lemma_translator.translate(lemma, ctx)]
+        for lemma in vyper_program.lemmas.values():
+            functions.extend(self.lemma_translator.translate(lemma, ctx))
 
         # Events
         events = [self._translate_event(event, ctx) for event in vyper_program.events.values()]
         accs = [self._translate_accessible(acc, ctx) for acc in vyper_program.functions.values()]
-        predicates.extend([*events, *accs])
+        predicates.extend(events)
+        predicates.extend(accs)
 
         # Viper methods
         def translate_condition_for_vyper_function(func: VyperFunction) -> bool:
@@ -305,7 +312,7 @@ class ProgramTranslator(CommonTranslator):
         methods.append(self._create_transitivity_check(ctx))
         methods.append(self._create_reflexivity_check(ctx))
         methods.append(self._create_forced_ether_check(ctx))
-        methods += [self.function_translator.translate(function, ctx) for function in vyper_functions]
+        methods.extend(self.function_translator.translate(function, ctx) for function in vyper_functions)
 
         for i, t in enumerate(self.viper_ast.seq_types):
             type_vars = { self.viper_ast.TypeVar('$E') : t }
@@ -316,7 +323,7 @@ class ProgramTranslator(CommonTranslator):
         viper_program = self.viper_ast.Program(domains, [], functions, predicates, methods)
         return viper_program
 
-    def _translate_struct(self, struct: VyperStruct, ctx: Context):
+    def _translate_struct(self, struct: VyperStruct, ctx: Context, member_types: Optional[Dict[str, Type]] = None):
         # For structs we need to synthesize an initializer and an equality domain function with
         # their corresponding axioms
         domain = mangled.struct_name(struct.name, struct.type.kind)
@@ -327,12 +334,15 @@ class ProgramTranslator(CommonTranslator):
         members = [None] * number_of_members
         for name, vyper_type in struct.type.member_types.items():
             idx = struct.type.member_indices[name]
-            member_type = self.type_translator.translate(vyper_type, ctx)
+            if member_types is None:
+                member_type = self.type_translator.translate(vyper_type, ctx)
+            else:
+                member_type = member_types[name]
             var_decl = self.viper_ast.LocalVarDecl(f'$arg_{idx}', member_type)
-            members[idx] = (name, var_decl)
+            members[idx] = (name, vyper_type, var_decl)
 
         init_name = mangled.struct_init_name(struct.name, struct.type.kind)
-        init_parms = [var for _, var in members]
+        init_parms = [var for _, _, var in members]
         resource_address_var = None
         if isinstance(struct, Resource) and not (struct.name == mangled.CREATOR or struct.name == names.UNDERLYING_WEI):
             # First argument has to be an address for resources if it is not the creator resource
@@ -360,15 +370,15 @@ class ProgramTranslator(CommonTranslator):
         rtag = helpers.struct_type_tag(self.viper_ast, eq_right)
         eq_expr = self.viper_ast.EqCmp(ltag, rtag)
 
-        for name, var in members:
-            init_get = helpers.struct_get(self.viper_ast, init, name, var.typ(), struct.type)
+        for name, vyper_type, var in members:
+            viper_type = var.typ()
+            init_get = helpers.struct_get(self.viper_ast, init, name, viper_type, struct.type)
             init_eq = self.viper_ast.EqCmp(init_get, var.localVar())
             init_expr = self.viper_ast.And(init_expr, init_eq)
 
-            eq_get_l = helpers.struct_get(self.viper_ast, eq_left, name, var.typ(), struct.type)
-            eq_get_r = helpers.struct_get(self.viper_ast, eq_right, name, var.typ(), struct.type)
-            member_type = struct.type.member_types[name]
-            eq_eq = self.type_translator.eq(eq_get_l, eq_get_r, member_type, ctx)
+            eq_get_l = helpers.struct_get(self.viper_ast, eq_left, name, viper_type, struct.type)
+            eq_get_r = helpers.struct_get(self.viper_ast, eq_right, name, viper_type, struct.type)
+            eq_eq = self.type_translator.eq(eq_get_l, eq_get_r, vyper_type, ctx)
             eq_expr = self.viper_ast.And(eq_expr, eq_eq)
 
         if isinstance(struct, Resource) and not (struct.name == mangled.CREATOR or struct.name == names.UNDERLYING_WEI):
@@ -452,7 +462,7 @@ class ProgramTranslator(CommonTranslator):
             implements.append(helpers.implements(self.viper_ast, self_address, interface.name, ctx))
 
         axiom_name = mangled.axiom_name(domain)
-        axiom_body = reduce(self.viper_ast.And, implements, self.viper_ast.TrueLit())
+        axiom_body = helpers.conjunction(self.viper_ast, implements)
         axiom = self.viper_ast.DomainAxiom(axiom_name, axiom_body, domain)
         return self.viper_ast.Domain(domain, [], [axiom], {})
 
@@ -521,7 +531,7 @@ class ProgramTranslator(CommonTranslator):
             block = TranslatedVar(names.BLOCK, mangled.BLOCK, types.BLOCK_TYPE, self.viper_ast)
             ctx.locals[names.BLOCK] = block
             is_post = self.viper_ast.LocalVarDecl('$post', self.viper_ast.Bool)
-            local_vars = [*flatten(s.values() for s in states), block]
+            local_vars = [*chain.from_iterable(s.values() for s in states), block]
             local_vars = [var.var_decl(ctx) for var in local_vars]
             local_vars.append(is_post)
 
@@ -612,7 +622,7 @@ class ProgramTranslator(CommonTranslator):
             block = TranslatedVar(names.BLOCK, mangled.BLOCK, types.BLOCK_TYPE, self.viper_ast)
             ctx.locals[names.BLOCK] = block
             is_post = self.viper_ast.LocalVarDecl('$post', self.viper_ast.Bool)
-            local_vars = [*flatten(s.values() for s in states), block]
+            local_vars = [*chain.from_iterable(s.values() for s in states), block]
             local_vars = [var.var_decl(ctx) for var in local_vars]
             local_vars.append(is_post)
 
@@ -44,6 +44,16 @@ class TypeTranslator(CommonTranslator):
             types.VYPER_BYTE: viper_ast.Int,
             types.NON_NEGATIVE_INT: viper_ast.Int
         }
+        # Maps type classes to their default value handler, subclasses are added on first use
+        self._default_value_handlers = {
+            PrimitiveType: self._default_primitive,
+            MapType: self._default_map,
+            ArrayType: self._default_array,
+            StructType: self._default_struct,
+            ContractType: self._default_address,
+            InterfaceType: self._default_address,
+            TupleType: self._default_tuple
+        }
 
     def translate(self, type: VyperType, ctx: Context, is_local=True) -> Type:
         if isinstance(type, PrimitiveType):
@@ -51,7 +61,19 @@ class TypeTranslator(CommonTranslator):
                 return self.type_dict[type]
             else:
                 return self.wrapped_type_dict[type]
-        elif isinstance(type, MapType):
+
+        # Tuples always translate to the struct type, and their ids are not stable enough to be cached
+        if isinstance(type, TupleType):
+            return helpers.struct_type(self.viper_ast)
+
+        translated = ctx.translated_types.get(type)
+        if translated is None:
+            translated = self._translate_non_primitive(type, ctx)
+            ctx.translated_types[type] = translated
+        return translated
+
+    def _translate_non_primitive(self, type: VyperType, ctx: Context) -> Type:
+        if isinstance(type, MapType):
             key_type = self.translate(type.key_type, ctx)
             value_type = self.translate(type.value_type, ctx)
             return helpers.map_type(self.viper_ast, key_type, value_type)
@@ -62,58 +84,73 @@ class TypeTranslator(CommonTranslator):
             return helpers.struct_type(self.viper_ast)
         elif isinstance(type, (ContractType, InterfaceType)):
             return self.translate(types.VYPER_ADDRESS, ctx)
-        elif isinstance(type, TupleType):
-            return helpers.struct_type(self.viper_ast)
         else:
             assert False
 
     def default_value(self, node: Optional[ast.Node], type: VyperType, res: List[Stmt],
                       ctx: Context, is_local=True) -> Expr:
-        pos = self.no_position() if node is None else self.to_position(node, ctx)
+        pos = self.viper_ast.NoPosition if node is None else self.to_position(node, ctx)
         if type is types.VYPER_BOOL:
             return self.viper_ast.FalseLit(pos)
-        elif isinstance(type, PrimitiveType):
-            if is_local:
-                return self.viper_ast.IntLit(0, pos)
-            else:
-                return helpers.w_wrap(self.viper_ast, self.viper_ast.IntLit(0, pos), pos)
-        elif isinstance(type, MapType):
-            key_type = self.translate(type.key_type, ctx)
-            value_type = self.translate(type.value_type, ctx)
 
-            value_default = self.default_value(node, type.value_type, res, ctx)
-            return helpers.map_init(self.viper_ast, value_default, key_type, value_type, pos)
-        elif isinstance(type, ArrayType):
-            sizes = [type.size]
-            curr_type = type
-            while isinstance(curr_type.element_type, ArrayType):
-                # noinspection PyUnresolvedReferences
-                sizes.append(curr_type.element_type.size)
-                curr_type = curr_type.element_type
-            element_type = self.translate(curr_type.element_type, ctx)
-            if type.is_strict:
-                result = self.default_value(node, curr_type.element_type, res, ctx)
-                result_type = element_type
-                for size in sizes:
-                    result = helpers.array_init(self.viper_ast, result, size, result_type, pos)
-                    result_type = helpers.array_type(self.viper_ast, result_type)
-                return result
-            else:
-                return helpers.empty_array(self.viper_ast, element_type, pos)
-        elif isinstance(type, StructType):
-            init_args = {}
-            for name, member_type in type.member_types.items():
-                idx = type.member_indices[name]
-                val = self.default_value(node, member_type, res, ctx)
-                init_args[idx] = val
-            args = [init_args[i] for i in range(len(init_args))]
-            return helpers.struct_init(self.viper_ast, args, type, pos)
-        elif isinstance(type, (ContractType, InterfaceType)):
-            return self.default_value(node, types.VYPER_ADDRESS, res, ctx)
-        elif isinstance(type, TupleType):
-            return helpers.havoc_var(self.viper_ast, helpers.struct_type(self.viper_ast), ctx)
+        handler = self._default_value_handler(type.__class__)
+        return handler(node, type, res, ctx, is_local, pos)
+
+    def _default_value_handler(self, type_class):
+        handler = self._default_value_handlers.get(type_class)
+        if handler is None:
+            # The handled type hierarchies are disjoint, so the first handled base class decides
+            handler = next((self._default_value_handlers[base] for base in type_class.__mro__
+                            if base in self._default_value_handlers), None)
+            assert handler is not None
+            self._default_value_handlers[type_class] = handler
+        return handler
+
+    def _default_primitive(self, node, type: PrimitiveType, res, ctx, is_local, pos) -> Expr:
+        if is_local:
+            return self.viper_ast.IntLit(0, pos)
         else:
-            assert False
+            return helpers.w_wrap(self.viper_ast, self.viper_ast.IntLit(0, pos), pos)
+
+    def _default_map(self, node, type: MapType, res, ctx, is_local, pos) -> Expr:
+        key_type = self.translate(type.key_type, ctx)
+        value_type = self.translate(type.value_type, ctx)
+
+        value_default = self.default_value(node, type.value_type, res, ctx)
+        return helpers.map_init(self.viper_ast, value_default, key_type, value_type, pos)
+
+    def _default_array(self, node, type: ArrayType, res, ctx, is_local, pos) -> Expr:
+        sizes = [type.size]
+        curr_type = type
+        while isinstance(curr_type.element_type, ArrayType):
+            # noinspection PyUnresolvedReferences
+            sizes.append(curr_type.element_type.size)
+            curr_type = curr_type.element_type
+        element_type = self.translate(curr_type.element_type, ctx)
+        if type.is_strict:
+            result = self.default_value(node, curr_type.element_type, res, ctx)
+            result_type = element_type
+            for size in sizes:
+                result = helpers.array_init(self.viper_ast, result, size, result_type, pos)
+                result_type = helpers.array_type(self.viper_ast, result_type)
+            return result
+        else:
+            return helpers.empty_array(self.viper_ast, element_type, pos)
+
+    def _default_struct(self, node, type: StructType, res, ctx, is_local, pos) -> Expr:
+        init_args = {}
+        for name, member_type in type.member_types.items():
+            idx = type.member_indices[name]
+            val = self.default_value(node, member_type, res, ctx)
+            init_args[idx] = val
+        args = [init_args[i] for i in range(len(init_args))]
+        return helpers.struct_init(self.viper_ast, args, type, pos)
+
+    def _default_address(self, node, type: VyperType, res, ctx, is_local, pos) -> Expr:
+        return self.default_value(node, types.VYPER_ADDRESS, res, ctx)
+
+    def _default_tuple(self, node, type: TupleType, res, ctx, is_local, pos) -> Expr:
+        return helpers.havoc_var(self.viper_ast, helpers.struct_type(self.viper_ast), ctx)
 
     def type_assumptions(self, node, type: VyperType, ctx: Context) -> List[Expr]:
         """
@@ -123,6 +160,7 @@ class TypeTranslator(CommonTranslator):
         If mode == 0: constructs bounds
         If mode == 1: constructs array lengths
         """
+        no_overflows = ctx.program.config.has_option(names.CONFIG_NO_OVERFLOWS)
 
         def construct(type, node):
             ret = []
@@ -137,7 +175,7 @@ class TypeTranslator(CommonTranslator):
                 lcmp = self.viper_ast.LeCmp(lower, node)
                 ucmp = self.viper_ast.LeCmp(node, upper)
                 # If the no_overflows config option is enabled, we only assume non-negativity for uints
-                if ctx.program.config.has_option(names.CONFIG_NO_OVERFLOWS):
+                if no_overflows:
                     if types.is_unsigned(type):
                         bounds = lcmp
                     else:
@@ -217,8 +255,22 @@ class TypeTranslator(CommonTranslator):
 
             return ret
 
-        with ctx.quantified_var_scope():
-            return construct(type, node)
+        # The assumptions embed the node and Silver nodes are equal regardless of their position, therefore only
+        # local variables without position and info are memoized, by their name and Viper type
+        viper_ast = self.viper_ast
+        if (isinstance(node, viper_ast.ast.LocalVar)
+                and node.pos() == viper_ast.NoPosition and node.info() == viper_ast.NoInfo):
+            key = (node.name(), node.typ(), type, no_overflows)
+        else:
+            with ctx.quantified_var_scope():
+                return construct(type, node)
+
+        assumptions = ctx.type_assumptions.get(key)
+        if assumptions is None:
+            with ctx.quantified_var_scope():
+                assumptions = construct(type, node)
+            ctx.type_assumptions[key] = assumptions
+        return list(assumptions)
 
     def array_bounds_check(self, array, index, res: List[Stmt], ctx: Context):
         leq = self.viper_ast.LeCmp(self.viper_ast.IntLit(0), index)
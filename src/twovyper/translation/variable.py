@@ -5,7 +5,7 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from twovyper.translation import helpers
 
@@ -29,7 +29,15 @@ class TranslatedVar:
         self.pos = pos
         self.info = info
         self.is_local = is_local
-        self._type_translator = TypeTranslator(viper_ast)
+        self._lazy_type_translator: Optional[TypeTranslator] = None
+        self._local_vars: Dict[bool, Var] = {}
+
+    @property
+    def _type_translator(self) -> TypeTranslator:
+        # Creating a type translator allocates Viper types, only do so for variables which get translated
+        if self._lazy_type_translator is None:
+            self._lazy_type_translator = TypeTranslator(self.viper_ast)
+        return self._lazy_type_translator
 
     def var_decl(self, ctx: Context, pos=None, info=None) -> VarDecl:
         pos = pos or self.pos
@@ -38,8 +46,15 @@ class TranslatedVar:
         return self.viper_ast.LocalVarDecl(self.mangled_name, vtype, pos, info)
 
     def local_var(self, ctx: Context, pos=None, info=None) -> Var:
-        pos = pos or self.pos
-        info = info or self.info
+        if pos is None and info is None:
+            # Without an explicit position and info the variable is the same on every use
+            local_var = self._local_vars.get(self.is_local)
+            if local_var is None:
+                local_var = self._local_vars[self.is_local] = self._create_local_var(ctx, self.pos, self.info)
+            return local_var
+        return self._create_local_var(ctx, pos or self.pos, info or self.info)
+
+    def _create_local_var(self, ctx: Context, pos, info) -> Var:
         vtype = self._type_translator.translate(self.type, ctx, is_local=self.is_local)
         return self.viper_ast.LocalVar(self.mangled_name, vtype, pos, info)
 
@@ -8,8 +8,9 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 import importlib
 import os
 from contextlib import contextmanager
+from itertools import chain
 from types import ModuleType
-from typing import Callable, Iterable, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 
 
 _ = object()
@@ -17,6 +18,20 @@ _ = object()
 
 @contextmanager
 def switch(*values):
+    if len(values) == 1:
+        # Most switches are over a single value, match it without zipping
+        value = values[0]
+
+        def match(*v, where=True):
+            if not where or len(v) != 1:
+                return False
+
+            case = v[0]
+            return case is _ or value == case
+
+        yield match
+        return
+
     def match(*v, where=True):
         if not where or len(values) != len(v):
             return False
@@ -38,34 +53,30 @@ def first_index(statisfying: Callable[[T], bool], l) -> int:
 
 
 def flatten(iterables: Iterable[Iterable[T]]) -> List[T]:
-    return [item for subiterable in iterables for item in subiterable]
+    return list(chain.from_iterable(iterables))
 
 
-def unique(eq, iterable: Iterable[T]) -> List[T]:
-    unique_iterable: List[T] = []
+def unique(key, iterable: Iterable[T]) -> List[T]:
+    unique_iterable: Dict[Any, T] = {}
     for elem in iterable:
-        for uelem in unique_iterable:
-            if eq(elem, uelem):
-                break
-        else:
-            unique_iterable.append(elem)
+        unique_iterable.setdefault(key(elem), elem)
 
-    return unique_iterable
+    return list(unique_iterable.values())
 
 
-def seq_to_list(scala_iterable):
+def iterator_to_list(it) -> List:
     lst = []
-    it = scala_iterable.iterator()
-    while it.hasNext():
-        lst.append(it.next())
+    # Bind the Java methods once, every attribute access on a Java object goes through JPype
+    has_next = it.hasNext
+    next_element = it.next
+    append = lst.append
+    while has_next():
+        append(next_element())
     return lst
 
 
-def list_to_seq(lst, jvm):
-    seq = jvm.scala.collection.mutable.ArraySeq(len(lst))
-    for i, element in enumerate(lst):
-        seq.update(i, element)
-    return seq
+def seq_to_list(scala_iterable):
+    return iterator_to_list(scala_iterable.iterator())
 
 
 def reload_package(package):
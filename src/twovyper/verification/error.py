@@ -51,6 +51,8 @@ class Position:
 
 class Via:
 
+    __slots__ = ('origin', 'position')
+
     def __init__(self, origin: str, position: AbstractSourcePosition):
         self.origin = origin
         self.position = position
@@ -58,6 +60,9 @@ class Via:
 
 class ErrorInfo:
 
+    # One error info is registered per translated position, so keep them small
+    __slots__ = ('node', 'vias', 'model_transformation', 'values')
+
     def __init__(self,
                  node: ast.Node,
                  vias: List[Via],
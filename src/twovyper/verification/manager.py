@@ -49,12 +49,10 @@ class ErrorManager:
 
         It does that by wrapping in ``Error`` subclasses.
         """
-        def eq(e1: Error, e2: Error) -> bool:
-            ide = e1.string(True, False) == e2.string(True, False)
-            normal = e1.string(False, False) == e2.string(False, False)
-            return ide and normal
+        def key(e: Error):
+            return e.string(True, False), e.string(False, False)
 
-        return unique(eq, [self._convert_error(error, jvm) for error in errors])
+        return unique(key, [self._convert_error(error, jvm) for error in errors])
 
     def get_vias(self, node_id: str) -> List[Any]:
         """Get via information for the given ``node_id``."""
@@ -91,12 +89,16 @@ class ErrorManager:
         rules = self._get_conversion_rules(node.pos())
         if rules or not jvm:
             return rules
-        if (isinstance(node, jvm.viper.silver.ast.And) or
-                isinstance(node, jvm.viper.silver.ast.Implies)):
-            return (self._get_conversion_rules(node.left().pos()) or
-                    self._get_conversion_rules(node.right().pos()) or
-                    self._try_get_rules_workaround(node.left(), jvm) or
-                    self._try_get_rules_workaround(node.right(), jvm))
+        viper_ast = jvm.viper.silver.ast
+        return self._try_get_rules_in_operands(node, (viper_ast.And, viper_ast.Implies))
+
+    def _try_get_rules_in_operands(self, node: Node, binary_classes) -> Optional[Rule]:
+        if isinstance(node, binary_classes):
+            left, right = node.left(), node.right()
+            return (self._get_conversion_rules(left.pos()) or
+                    self._get_conversion_rules(right.pos()) or
+                    self._try_get_rules_in_operands(left, binary_classes) or
+                    self._try_get_rules_in_operands(right, binary_classes))
         return
 
     def transformError(self, error: AbstractVerificationError) -> AbstractVerificationError:
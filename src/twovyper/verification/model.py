@@ -253,20 +253,21 @@ def translate_sort(jvm: JVM, s: Sort) -> str:
 
 
 def evaluate_term(jvm: JVM, term: Term, model: Dict[str, Any]) -> str:
-    if isinstance(term, getattr(jvm.viper.silicon.state.terms, 'Unit$')):
+    terms = jvm.viper.silicon.state.terms
+    if isinstance(term, getattr(terms, 'Unit$')):
         return '$Snap.unit'
-    if isinstance(term, jvm.viper.silicon.state.terms.IntLiteral):
+    if isinstance(term, terms.IntLiteral):
         return str(term)
-    if isinstance(term, jvm.viper.silicon.state.terms.BooleanLiteral):
+    if isinstance(term, terms.BooleanLiteral):
         return str(term)
-    if isinstance(term, jvm.viper.silicon.state.terms.Null):
+    if isinstance(term, terms.Null):
         return model['$Ref.null']
-    if isinstance(term, jvm.viper.silicon.state.terms.Var):
+    if isinstance(term, terms.Var):
         key = str(term)
         if key not in model:
             raise NoFittingValueException
         return model[key]
-    elif isinstance(term, jvm.viper.silicon.state.terms.App):
+    elif isinstance(term, terms.App):
         fname = str(term.applicable().id()) + '%limited'
         if fname not in model:
             fname = str(term.applicable().id())
@@ -277,26 +278,26 @@ def evaluate_term(jvm: JVM, term: Term, model: Dict[str, Any]) -> str:
             args.append(evaluate_term(jvm, arg, model))
         res = get_func_value(model, fname, tuple(args))
         return res
-    if isinstance(term, jvm.viper.silicon.state.terms.Combine):
+    if isinstance(term, terms.Combine):
         p0_val = evaluate_term(jvm, term.p0(), model)
         p1_val = evaluate_term(jvm, term.p1(), model)
         return '($Snap.combine ' + p0_val + ' ' + p1_val + ')'
-    if isinstance(term, jvm.viper.silicon.state.terms.First):
+    if isinstance(term, terms.First):
         sub = evaluate_term(jvm, term.p(), model)
         if sub.startswith('($Snap.combine '):
             return get_parts(jvm, sub)[1]
-    elif isinstance(term, jvm.viper.silicon.state.terms.Second):
+    elif isinstance(term, terms.Second):
         sub = evaluate_term(jvm, term.p(), model)
         if sub.startswith('($Snap.combine '):
             return get_parts(jvm, sub)[2]
-    elif isinstance(term, jvm.viper.silicon.state.terms.SortWrapper):
+    elif isinstance(term, terms.SortWrapper):
         sub = evaluate_term(jvm, term.t(), model)
         from_sort_name = translate_sort(jvm, term.t().sort())
         to_sort_name = translate_sort(jvm, term.to())
         return get_func_value(model, SNAP_TO + from_sort_name + 'To' + to_sort_name, (sub,))
-    elif isinstance(term, jvm.viper.silicon.state.terms.PredicateLookup):
+    elif isinstance(term, terms.PredicateLookup):
         lookup_func_name = '$PSF.lookup_' + term.predname()
-        toSnapTree = getattr(jvm.viper.silicon.state.terms, 'toSnapTree$')
+        toSnapTree = getattr(terms, 'toSnapTree$')
         obj = getattr(toSnapTree, 'MODULE$')
         snap = obj.apply(term.args())
         psf_value = evaluate_term(jvm, term.psf(), model)
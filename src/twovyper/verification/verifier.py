@@ -9,15 +9,14 @@ import abc
 import logging
 
 from enum import Enum
-from typing import Optional, Any
+from typing import Any, List, Optional
 
 from jpype import JPackage
 
 from twovyper import config
 
-from twovyper.utils import list_to_seq
-
-from twovyper.viper.typedefs import Program
+from twovyper.viper.ast import list_to_seq
+from twovyper.viper.typedefs import AbstractVerificationError, Program
 from twovyper.viper.jvmaccess import JVM
 
 from twovyper.verification.result import VerificationResult, Success, Failure
@@ -28,6 +27,15 @@ class AbstractVerifier(abc.ABC):
     def __init__(self):
         self.jvm: Optional[JVM] = None
         self.silver: Optional[JPackage] = None
+        self.failure_class: Optional[Any] = None
+
+    def _errors(self, failure) -> List[AbstractVerificationError]:
+        """
+        Converts the errors of a failure to a Python list in one JVM call
+        instead of iterating over the Scala sequence
+        """
+        errors = self.jvm.scala.collection.JavaConverters.seqAsJavaList(failure.errors())
+        return errors.toArray()[:]
 
     @abc.abstractmethod
     def _initialize(self, jvm: JVM, file: str, get_model: bool = False):
@@ -50,6 +58,7 @@ class Silicon(AbstractVerifier):
     def _initialize(self, jvm: JVM, filename: str, get_model: bool = False):
         self.jvm = jvm
         self.silver = jvm.viper.silver
+        self.failure_class = self.silver.verifier.Failure
         if not jvm.is_known_class(jvm.viper.silicon.Silicon):
             raise Exception('Silicon backend not found on classpath.')
         self.silicon = jvm.viper.silicon.Silicon()
@@ -74,20 +83,23 @@ class Silicon(AbstractVerifier):
             self._initialize(jvm, filename, get_model)
             assert self.silicon is not None
         result = self.silicon.verify(program)
-        if isinstance(result, self.silver.verifier.Failure):
+        if isinstance(result, self.failure_class):
             logging.info("Silicon returned with: Failure.")
-            it = result.errors().toIterator()
-            errors = []
-            while it.hasNext():
-                errors += [it.next()]
-            return Failure(errors, self.jvm)
+            return Failure(self._errors(result), self.jvm)
         else:
             logging.info("Silicon returned with: Success.")
             return Success()
 
-    def __del__(self):
+    def close(self):
+        """
+        Stops the backend, it gets restarted on the next call to verify
+        """
         if self.silicon is not None:
             self.silicon.stop()
+            self.silicon = None
+
+    def __del__(self):
+        self.close()
 
 
 class Carbon(AbstractVerifier):
@@ -101,6 +113,7 @@ class Carbon(AbstractVerifier):
 
     def _initialize(self, jvm: JVM, filename: str, get_model: bool = False):
         self.silver = jvm.viper.silver
+        self.failure_class = self.silver.verifier.Failure
         if not jvm.is_known_class(jvm.viper.carbon.CarbonVerifier):
             raise Exception('Carbon backend not found on classpath.')
         if config.boogie_path is None:
@@ -128,20 +141,23 @@ class Carbon(AbstractVerifier):
             self._initialize(jvm, filename, get_model)
             assert self.carbon is not None
         result = self.carbon.verify(program)
-        if isinstance(result, self.silver.verifier.Failure):
+        if isinstance(result, self.failure_class):
             logging.info("Carbon returned with: Failure.")
-            it = result.errors().toIterator()
-            errors = []
-            while it.hasNext():
-                errors += [it.next()]
-            return Failure(errors)
+            return Failure(self._errors(result))
         else:
             logging.info("Carbon returned with: Success.")
             return Success()
 
-    def __del__(self):
+    def close(self):
+        """
+        Stops the backend, it gets restarted on the next call to verify
+        """
         if self.carbon is not None:
             self.carbon.stop()
+            self.carbon = None
+
+    def __del__(self):
+        self.close()
 
 
 class ViperVerifier(Enum):
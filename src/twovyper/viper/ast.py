@@ -5,7 +5,15 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from jpype import JImplements, JOverride
+from jpype import JArray, JImplements, JObject, JOverride
+
+from twovyper.utils import iterator_to_list
+
+
+def list_to_seq(lst, jvm):
+    # The list is transferred as one Java array, which the Scala sequence wraps
+    array = JArray(JObject)(lst)
+    return jvm.scala.collection.mutable.WrappedArray.make(array)
 
 
 class ViperAST:
@@ -57,7 +65,27 @@ class ViperAST:
         self.MethodWithLabelsInScope = getobject(self.ast, 'MethodWithLabelsInScope')
         self.BigInt = getobject(self.scala.math, 'BigInt')
         self.None_ = getobject(self.scala, 'None')
+        self.Nil = getobject(self.scala.collection.immutable, 'Nil')
         self.seq_types = set()
+        # Literals without position and info are immutable and can be shared
+        self._true_lit = self.ast.TrueLit(self.NoPosition, self.NoInfo, self.NoTrafos)
+        self._false_lit = self.ast.FalseLit(self.NoPosition, self.NoInfo, self.NoTrafos)
+        self._null_lit = self.ast.NullLit(self.NoPosition, self.NoInfo, self.NoTrafos)
+        self._full_perm = self.ast.FullPerm(self.NoPosition, self.NoInfo, self.NoTrafos)
+        self._no_perm = self.ast.NoPerm(self.NoPosition, self.NoInfo, self.NoTrafos)
+        self._wildcard_perm = self.ast.WildcardPerm(self.NoPosition, self.NoInfo, self.NoTrafos)
+        self._int_lits = {}
+        self._big_ints = {}
+        self._empty_seqn = self.ast.Seqn(self.Nil, self.Nil, self.NoPosition, self.NoInfo, self.NoTrafos)
+        self._empty_seqns = {}
+        # Every position of a file refers to the same path
+        self._paths = {}
+        # Nodes are translated many times, but only the error id of their positions differs
+        self._line_columns = {}
+        self._domain_types = {}
+        # Type variables are looked up by name for every map, array and struct access
+        self._type_vars = {}
+        self._simple_infos = {}
 
     def is_available(self) -> bool:
         """
@@ -86,17 +114,15 @@ class ViperAST:
             list.append(lsttoappend)
 
     def to_seq(self, py_iterable):
-        result = self.scala.collection.mutable.ArraySeq(len(py_iterable))
-        for index, value in enumerate(py_iterable):
-            result.update(index, value)
-        return result.toList()
+        # Empty sequences, e.g., the else branch of most ifs or the locals of most seqns, share Nil
+        if not py_iterable:
+            return self.Nil
+        # Statement lists are already materialized and do not need to be copied first
+        elements = py_iterable if isinstance(py_iterable, list) else list(py_iterable)
+        return list_to_seq(elements, self.jvm).toList()
 
     def to_list(self, seq):
-        result = []
-        iterator = seq.toIterator()
-        while iterator.hasNext():
-            result.append(iterator.next())
-        return result
+        return iterator_to_list(seq.toIterator())
 
     def to_map(self, dict):
         result = self.scala.collection.immutable.HashMap()
@@ -105,9 +131,14 @@ class ViperAST:
         return result
 
     def to_big_int(self, num: int):
-        # Python ints might not fit into a C int, therefore we use a String
-        num_str = str(num)
-        return self.BigInt.apply(num_str)
+        # BigInts are immutable, positioned literals of the same value can share them
+        big_int = self._big_ints.get(num)
+        if big_int is None:
+            # Python ints might not fit into a C int, therefore we use a String
+            num_str = str(num)
+            big_int = self.BigInt.apply(num_str)
+            self._big_ints[num] = big_int
+        return big_int
 
     def Program(self, domains, fields, functions, predicates, methods, position=None, info=None):
         position = position or self.NoPosition
@@ -209,6 +240,12 @@ class ViperAST:
                                          self.NoTrafos)
 
     def DomainType(self, name, type_vars_map, type_vars):
+        if not type_vars_map and not type_vars:
+            # Domain types without type variables (e.g. structs, wrapped ints) are built once per domain
+            domain_type = self._domain_types.get(name)
+            if domain_type is None:
+                domain_type = self._domain_types[name] = self.ast.DomainType(name, self.to_map({}), self.Nil)
+            return domain_type
         map = self.to_map(type_vars_map)
         seq = self.to_seq(type_vars)
         return self.ast.DomainType(name, map,
@@ -227,7 +264,10 @@ class ViperAST:
         return result
 
     def TypeVar(self, name):
-        return self.ast.TypeVar(name)
+        type_var = self._type_vars.get(name)
+        if type_var is None:
+            type_var = self._type_vars[name] = self.ast.TypeVar(name)
+        return type_var
 
     def MethodCall(self, method_name, args, targets, position=None, info=None):
         position = position or self.NoPosition
@@ -251,6 +291,15 @@ class ViperAST:
         return self.ast.Goto(name, position, info, self.NoTrafos)
 
     def Seqn(self, body, position=None, info=None, locals=[]):
+        if not body and not locals and (info is None or info is self.NoInfo):
+            if position is None or position is self.NoPosition:
+                return self._empty_seqn
+            # Every if statement without an else branch has an empty block at the position of the if
+            seqn = self._empty_seqns.get(position)
+            if seqn is None:
+                seqn = self.ast.Seqn(self.Nil, self.Nil, position, self.NoInfo, self.NoTrafos)
+                self._empty_seqns[position] = seqn
+            return seqn
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.Seqn(self.to_seq(body), self.to_seq(locals), position, info,
@@ -307,16 +356,22 @@ class ViperAST:
         return self.ast.Assert(expr, position, info, self.NoTrafos)
 
     def FullPerm(self, position=None, info=None):
+        if (position is None or position is self.NoPosition) and (info is None or info is self.NoInfo):
+            return self._full_perm
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.FullPerm(position, info, self.NoTrafos)
 
     def NoPerm(self, position=None, info=None):
+        if (position is None or position is self.NoPosition) and (info is None or info is self.NoInfo):
+            return self._no_perm
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.NoPerm(position, info, self.NoTrafos)
 
     def WildcardPerm(self, position=None, info=None):
+        if (position is None or position is self.NoPosition) and (info is None or info is self.NoInfo):
+            return self._wildcard_perm
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.WildcardPerm(position, info, self.NoTrafos)
@@ -432,6 +487,12 @@ class ViperAST:
         return self.ast.LeCmp(left, right, position, info, self.NoTrafos)
 
     def IntLit(self, num, position=None, info=None):
+        if (position is None or position is self.NoPosition) and (info is None or info is self.NoInfo):
+            lit = self._int_lits.get(num)
+            if lit is None:
+                lit = self.ast.IntLit(self.to_big_int(num), self.NoPosition, self.NoInfo, self.NoTrafos)
+                self._int_lits[num] = lit
+            return lit
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.IntLit(self.to_big_int(num), position, info, self.NoTrafos)
@@ -577,23 +638,29 @@ class ViperAST:
         return self.ast.Or(left, right, position, info, self.NoTrafos)
 
     def If(self, cond, thn, els, position=None, info=None):
-        position = position or self.NoPosition
-        info = info or self.NoInfo
         thn_seqn = self.Seqn(thn, position)
         els_seqn = self.Seqn(els, position)
+        position = position or self.NoPosition
+        info = info or self.NoInfo
         return self.ast.If(cond, thn_seqn, els_seqn, position, info, self.NoTrafos)
 
     def TrueLit(self, position=None, info=None):
+        if (position is None or position is self.NoPosition) and (info is None or info is self.NoInfo):
+            return self._true_lit
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.TrueLit(position, info, self.NoTrafos)
 
     def FalseLit(self, position=None, info=None):
+        if (position is None or position is self.NoPosition) and (info is None or info is self.NoInfo):
+            return self._false_lit
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.FalseLit(position, info, self.NoTrafos)
 
     def NullLit(self, position=None, info=None):
+        if (position is None or position is self.NoPosition) and (info is None or info is self.NoInfo):
+            return self._null_lit
         position = position or self.NoPosition
         info = info or self.NoInfo
         return self.ast.NullLit(position, info, self.NoTrafos)
@@ -655,16 +722,27 @@ class ViperAST:
         return Function0()
 
     def SimpleInfo(self, comments):
-        return self.ast.SimpleInfo(self.to_seq(comments))
+        # Most infos are constant comments, e.g. of loop iterations, build each of them only once
+        key = tuple(comments)
+        info = self._simple_infos.get(key)
+        if info is None:
+            info = self._simple_infos[key] = self.ast.SimpleInfo(self.to_seq(comments))
+        return info
 
     def ConsInfo(self, head, tail):
         return self.ast.ConsInfo(head, tail)
 
     def to_position(self, expr, id: str):
-        path = self.java.nio.file.Paths.get(expr.file, [])
-        start = self.ast.LineColumnPosition(expr.lineno, expr.col_offset)
-        end = self.ast.LineColumnPosition(expr.end_lineno, expr.end_col_offset)
-        end = self.scala.Some(end)
+        path = self._paths.get(expr.file)
+        if path is None:
+            path = self._paths[expr.file] = self.java.nio.file.Paths.get(expr.file, [])
+        key = (expr.lineno, expr.col_offset, expr.end_lineno, expr.end_col_offset)
+        line_columns = self._line_columns.get(key)
+        if line_columns is None:
+            start = self.ast.LineColumnPosition(expr.lineno, expr.col_offset)
+            end = self.ast.LineColumnPosition(expr.end_lineno, expr.end_col_offset)
+            line_columns = self._line_columns[key] = (start, self.scala.Some(end))
+        start, end = line_columns
         return self.ast.IdentifierPosition(path, start, end, id)
 
     def is_heap_dependent(self, expr) -> bool:
@@ -672,10 +750,10 @@ class ViperAST:
         Checks if the given expression contains an access to a heap location.
         Does NOT check for calls to heap-dependent functions.
         """
-        for n in [expr] + self.to_list(expr.subnodes()):
-            if isinstance(n, self.ast.LocationAccess):
-                return True
-        return False
+        location_access = self.ast.LocationAccess
+        if isinstance(expr, location_access):
+            return True
+        return any(isinstance(n, location_access) for n in self.to_list(expr.subnodes()))
 
     # SIF extension AST nodes
 
@@ -18,6 +18,7 @@ Program = Any  # 'silver.ast.Program'
 Field = Any  # 'silver.ast.Field'
 Method = Any  # 'silver.ast.Method'
 Function = Any  # 'silver.ast.Function'
+Predicate = Any  # 'silver.ast.Predicate'
 
 Domain = Any  # 'silver.ast.Domain'
 DomainAxiom = Any  # 'silver.ast.DomainAxiom'